@@ -15,7 +15,21 @@ User data api for FUO bot.
 ### user
 
 * **Get user score**: Get the user's total score across all guilds (servers). Path `/v1/user/{user_id}/score`
+* **Get users scores**: Get scores of many users by type in one request. Path `/v1/user/scores`
 * **Get user score logs**: Get score incoming logs of the user. Path `/v1/user/{user_id}/score/logs`
+
+### guild
+
+* **Get guild leaderboard**: Get members of the guild (server) ranked by score. Path `/v1/guild/{guild_id}/leaderboard`
+
+### export
+
+* **Export score logs**: Stream score logs of a guild or a time range as NDJSON. Path `/v1/export/score/logs`
+
+### events
+
+* **Score events**: Server-sent events of score awards of a guild or a member. Path `/v1/events/score`
+* **Score events websocket**: The same events over a websocket. Path `/v1/events/score/ws`
 """
 
 
@@ -1,7 +1,13 @@
 from fastapi import APIRouter
 
+from .events import router as EventsRouter
+from .export import router as ExportRouter
+from .guild import router as GuildRouter
 from .user import router as UserRouter
 
 router = APIRouter(prefix="/v1")
 
 router.include_router(UserRouter)
+router.include_router(GuildRouter)
+router.include_router(ExportRouter)
+router.include_router(EventsRouter)
@@ -0,0 +1,81 @@
+import asyncio
+import json
+from typing import AsyncGenerator, Optional
+
+from anyio import create_task_group
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from typing_extensions import Annotated
+
+from fuo.score import score_events
+
+router = APIRouter(prefix="/events")
+
+# seconds between keep-alive comments of an idle event stream
+KEEPALIVE_INTERVAL = 15
+
+
+async def _score_event_stream(
+    guild_id: Optional[int], member_id: Optional[int]
+) -> AsyncGenerator[str, None]:
+    # the subscription lives as long as the response is streamed
+    with score_events.subscribe(guild_id=guild_id, member_id=member_id) as sub:
+        while True:
+            try:
+                event = await asyncio.wait_for(sub.get(), timeout=KEEPALIVE_INTERVAL)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if event is None:
+                # the subscriber is too slow and has been dropped
+                return
+            yield f"event: score\ndata: {json.dumps(event.to_dict())}\n\n"
+
+
+@router.get("/score", response_class=StreamingResponse)
+async def get_score_events(
+    guild_id: Annotated[
+        Optional[int],
+        Query(title="Guild id", description="Optional. Only send awards in the guild."),
+    ] = None,
+    member_id: Annotated[
+        Optional[int],
+        Query(
+            title="Member id", description="Optional. Only send awards of the member."
+        ),
+    ] = None,
+) -> StreamingResponse:
+    return StreamingResponse(
+        _score_event_stream(guild_id=guild_id, member_id=member_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@router.websocket("/score/ws")
+async def score_events_ws(
+    websocket: WebSocket,
+    guild_id: Optional[int] = None,
+    member_id: Optional[int] = None,
+):
+    await websocket.accept()
+    with score_events.subscribe(guild_id=guild_id, member_id=member_id) as sub:
+        async with create_task_group() as tg:
+
+            async def _wait_disconnect():
+                try:
+                    while True:
+                        await websocket.receive_text()
+                except WebSocketDisconnect:
+                    tg.cancel_scope.cancel()
+
+            tg.start_soon(_wait_disconnect)
+
+            while True:
+                event = await sub.get()
+                if event is None:
+                    # the subscriber is too slow and has been dropped
+                    await websocket.close(code=1013)
+                    tg.cancel_scope.cancel()
+                    return
+                await websocket.send_json(event.to_dict())
@@ -0,0 +1,65 @@
+import json
+from datetime import datetime
+from typing import AsyncGenerator, Optional
+
+import sqlalchemy as sa
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+from typing_extensions import Annotated
+
+from fuo import db, models
+
+router = APIRouter(prefix="/export")
+
+# rows fetched from the server-side cursor at a time
+EXPORT_CHUNK_SIZE = 1000
+
+
+async def _score_log_lines(q: sa.Select) -> AsyncGenerator[str, None]:
+    # the session lives as long as the response is streamed
+    async with db.session_scope() as sess:
+        logs = await sess.stream_scalars(
+            q.execution_options(yield_per=EXPORT_CHUNK_SIZE)
+        )
+        async for chunk in logs.partitions():
+            yield "".join(
+                json.dumps(
+                    {
+                        "id": log.id,
+                        "guild_id": log.guild_id,
+                        "channel_id": log.channel_id,
+                        "member_id": log.member_id,
+                        "source": log.score_src.value,
+                        "score": log.score,
+                        "created_at": log.created_at.isoformat(),
+                    }
+                )
+                + "\n"
+                for log in chunk
+            )
+
+
+@router.get("/score/logs", response_class=StreamingResponse)
+async def export_score_logs(
+    guild_id: Annotated[
+        Optional[int],
+        Query(title="Guild id", description="Optional. Only export logs of the guild."),
+    ] = None,
+    since: Annotated[
+        Optional[datetime],
+        Query(title="Since", description="Optional. Only export logs since the time."),
+    ] = None,
+    until: Annotated[
+        Optional[datetime],
+        Query(title="Until", description="Optional. Only export logs until the time."),
+    ] = None,
+) -> StreamingResponse:
+    q = sa.select(models.ScoreLog).order_by(sa.asc(models.ScoreLog.id))
+    if guild_id is not None:
+        q = q.where(models.ScoreLog.guild_id == guild_id)
+    if since is not None:
+        q = q.where(models.ScoreLog.created_at >= since)
+    if until is not None:
+        q = q.where(models.ScoreLog.created_at < until)
+
+    return StreamingResponse(_score_log_lines(q), media_type="application/x-ndjson")
@@ -0,0 +1,71 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Path, Query
+from pydantic import BaseModel, Field
+from typing_extensions import Annotated
+
+from fuo import models
+from fuo.bot import bot
+from fuo.score import leaderboard
+
+router = APIRouter(prefix="/guild")
+
+
+class LeaderboardEntry(BaseModel):
+    rank: int = Field(title="Rank", description="Rank of the member, from 1")
+    member_id: int = Field(title="Member id", description="The discord user id")
+    name: Optional[str] = Field(
+        title="Name",
+        description="Member name. Null if the member is not in the bot's cache.",
+    )
+    score: float = Field(title="Score", description="Score of the member")
+
+
+class Leaderboard(BaseModel):
+    total: int = Field(title="Total", description="Count of ranked members")
+    entries: List[LeaderboardEntry] = Field(title="Entries")
+
+
+@router.get("/{guild_id}/leaderboard", response_model=Leaderboard)
+async def get_guild_leaderboard(
+    guild_id: Annotated[
+        int, Path(title="The guild id", description="The discord guild (server) id")
+    ],
+    type: Annotated[
+        Optional[models.ScoreType],
+        Query(
+            title="Score type",
+            description="Optional. Can be post, question or chat. "
+            "When score type is not set, means to rank total scores of all types.",
+        ),
+    ] = None,
+    offset: Annotated[
+        int,
+        Query(ge=0, title="Offset", description="Optional. Default value is 0."),
+    ] = 0,
+    limit: Annotated[
+        int,
+        Query(
+            ge=1,
+            le=100,
+            title="Limit",
+            description="Optional. Default value is 10. "
+            "Limit should be between 1 and 100.",
+        ),
+    ] = 10,
+) -> Leaderboard:
+    board = leaderboard.get(guild_id=guild_id, score_type=type)
+    guild = bot.get_guild(guild_id)
+
+    entries = []
+    for i, (member_id, score) in enumerate(board.top(limit, offset=offset)):
+        member = guild.get_member(member_id) if guild is not None else None
+        entries.append(
+            LeaderboardEntry(
+                rank=offset + i + 1,
+                member_id=member_id,
+                name=member.name if member is not None else None,
+                score=score,
+            )
+        )
+    return Leaderboard(total=len(board), entries=entries)
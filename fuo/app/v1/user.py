@@ -1,16 +1,23 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional
 
 import discord
-import sqlalchemy as sa
-from anyio import create_task_group
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing_extensions import Annotated
 
 from fuo import db, models
+from fuo.score import get_member_score, get_members_scores, member_logs_query
 
-from .utils import OrderParam, get_channel, get_guild, get_user
+from .utils import (
+    OrderParam,
+    channel_directory,
+    decode_cursor,
+    encode_cursor,
+    get_user,
+    guild_directory,
+)
 
 router = APIRouter(prefix="/user")
 
@@ -21,7 +28,7 @@ class UserScore(BaseModel):
 
 @router.get("/{user_id}/score", response_model=UserScore)
 async def get_user_score(
-    user: Annotated[discord.User, Depends(get_user)],
+    user: Annotated[discord.abc.Snowflake, Depends(get_user)],
     type: Annotated[
         Optional[models.ScoreType],
         Query(
@@ -30,43 +37,120 @@ async def get_user_score(
             "When score type is not set, means to get total score of all types.",
         ),
     ] = None,
+    period: Annotated[
+        Optional[models.ScorePeriod],
+        Query(
+            title="Period",
+            description="Optional. Can be day, week or month. "
+            "When period is set, means to get score since the start of "
+            "the current period.",
+        ),
+    ] = None,
     *,
     sess: Annotated[AsyncSession, Depends(db.get_session)],
 ) -> UserScore:
-    q = sa.select(
-        models.UserScore.member_id, sa.func.sum(models.UserScore.score).label("sum")
-    ).where(models.UserScore.member_id == user.id)
-    if type is not None:
-        q = q.where(models.UserScore.score_type == type)
-    q = q.group_by(models.UserScore.member_id)
+    score = await get_member_score(
+        sess, member_id=user.id, score_type=type, period=period
+    )
+    return UserScore(score=score)
 
-    res = (await sess.execute(q)).first()
-    if res is None:
-        return UserScore(score=0)
 
-    return UserScore(score=res[1])
+MAX_BATCH_MEMBERS = 100
+
+
+class MemberScores(BaseModel):
+    member_id: int = Field(title="Member id", description="The discord user id")
+    score: float = Field(title="Score", description="Total score of the types")
+    scores: Dict[models.ScoreType, float] = Field(
+        title="Scores", description="Score of every type the member has"
+    )
+
+
+@router.get("/scores", response_model=List[MemberScores])
+async def get_users_scores(
+    member_ids: Annotated[
+        List[int],
+        Query(
+            alias="member_id",
+            title="Member ids",
+            description=f"The discord user ids. Can be repeated up to "
+            f"{MAX_BATCH_MEMBERS} times.",
+        ),
+    ],
+    guild_id: Annotated[
+        Optional[int],
+        Query(
+            title="Guild id",
+            description="Optional. When guild id is not set, "
+            "means to get scores across all guilds.",
+        ),
+    ] = None,
+    type: Annotated[
+        Optional[models.ScoreType],
+        Query(
+            title="Score type",
+            description="Optional. Can be post, question or chat. "
+            "When score type is not set, means to get scores of all types.",
+        ),
+    ] = None,
+    *,
+    sess: Annotated[AsyncSession, Depends(db.get_session)],
+) -> List[MemberScores]:
+    member_ids = list(dict.fromkeys(member_ids))
+    if len(member_ids) > MAX_BATCH_MEMBERS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"At most {MAX_BATCH_MEMBERS} member ids are accepted",
+        )
+
+    scores = await get_members_scores(
+        sess, member_ids=member_ids, guild_id=guild_id, score_type=type
+    )
+
+    # members are not resolved over discord, unknown ids just have no scores
+    return [
+        MemberScores(
+            member_id=member_id,
+            score=sum(member_scores.values()),
+            scores=member_scores,
+        )
+        for member_id, member_scores in scores.items()
+    ]
 
 
 class UserScoreLog(BaseModel):
-    guild: str = Field(title="Guild (server)", description="Guild (server) name")
-    channel: str = Field(title="Channel", description="Channel name")
+    guild: Optional[str] = Field(
+        title="Guild (server)",
+        description="Guild (server) name. Null if the guild is not found.",
+    )
+    channel: Optional[str] = Field(
+        title="Channel", description="Channel name. Null if the channel is not found."
+    )
     source: models.ScoreSource = Field(
         title="The reason of score",
         description="Where the incoming score comes from. "
         "Can be post, post_reaction, question, answer, answer_reaction, chat and chat_reaction.",
     )
     score: float = Field(title="Score", description="The incoming score.")
+    created_at: datetime = Field(
+        title="Created at", description="When the incoming score comes."
+    )
+    cursor: str = Field(
+        title="Cursor",
+        description="Opaque cursor of the log, to be passed as after or before.",
+    )
 
 
 @router.get("/{user_id}/score/logs", response_model=List[UserScoreLog])
 async def get_user_score_logs(
-    user: Annotated[discord.User, Depends(get_user)],
+    user: Annotated[discord.abc.Snowflake, Depends(get_user)],
     page: Annotated[
         int,
         Query(
             ge=1,
             title="Page",
-            description="Optional. Default value is 1. Page should be greater than 1",
+            description="Optional. Default value is 1. Page should be greater than 1. "
+            "Ignored when after or before is set.",
         ),
     ] = 1,
     page_size: Annotated[
@@ -87,42 +171,57 @@ async def get_user_score_logs(
             "Optional. Default value is asc. Should be asc or desc.",
         ),
     ] = OrderParam.ASC,
+    after: Annotated[
+        Optional[str],
+        Query(
+            title="After",
+            description="Optional. Only return logs after the log of the cursor. "
+            "Pass the cursor of the last log to get the next page in asc order.",
+        ),
+    ] = None,
+    before: Annotated[
+        Optional[str],
+        Query(
+            title="Before",
+            description="Optional. Only return logs before the log of the cursor. "
+            "Pass the cursor of the last log to get the next page in desc order.",
+        ),
+    ] = None,
+    guild_id: Annotated[
+        Optional[int],
+        Query(title="Guild id", description="Optional. Only return logs of the guild."),
+    ] = None,
+    source: Annotated[
+        Optional[models.ScoreSource],
+        Query(title="Source", description="Optional. Only return logs of the source."),
+    ] = None,
+    since: Annotated[
+        Optional[datetime],
+        Query(title="Since", description="Optional. Only return logs since the time."),
+    ] = None,
+    until: Annotated[
+        Optional[datetime],
+        Query(title="Until", description="Optional. Only return logs until the time."),
+    ] = None,
     *,
     sess: Annotated[AsyncSession, Depends(db.get_session)],
 ) -> List[UserScoreLog]:
-    q = (
-        sa.select(models.ScoreLog)
-        .where(models.ScoreLog.member_id == user.id)
-        .limit(page_size)
-        .offset((page - 1) * page_size)
+    q = member_logs_query(
+        user.id,
+        limit=page_size,
+        offset=(page - 1) * page_size,
+        after_id=decode_cursor(after) if after is not None else None,
+        before_id=decode_cursor(before) if before is not None else None,
+        guild_id=guild_id,
+        score_src=source,
+        since=since,
+        until=until,
+        descending=order == OrderParam.DESC,
     )
-    if order == OrderParam.ASC:
-        q = q.order_by(sa.asc(models.ScoreLog.id))
-    else:
-        q = q.order_by(sa.desc(models.ScoreLog.id))
-
     logs = (await sess.execute(q)).scalars().all()
 
-    guild_ids = set(log.guild_id for log in logs)
-    channel_ids = set(log.channel_id for log in logs)
-
-    guild_names = {}
-
-    async def _set_guild_name(guild_id: int):
-        guild_names[guild_id] = (await get_guild(guild_id)).name
-
-    async with create_task_group() as tg:
-        for guild_id in guild_ids:
-            tg.start_soon(_set_guild_name, guild_id)
-
-    channel_names = {}
-
-    async def _set_channel_name(channel_id: int):
-        channel_names[channel_id] = (await get_channel(channel_id)).name
-
-    async with create_task_group() as tg:
-        for channel_id in channel_ids:
-            tg.start_soon(_set_channel_name, channel_id)
+    guild_names = await guild_directory.get_names(log.guild_id for log in logs)
+    channel_names = await channel_directory.get_names(log.channel_id for log in logs)
 
     res = [
         UserScoreLog(
@@ -130,6 +229,8 @@ async def get_user_score_logs(
             channel=channel_names[log.channel_id],
             source=log.score_src,
             score=log.score,
+            created_at=log.created_at,
+            cursor=encode_cursor(log.id),
         )
         for log in logs
     ]
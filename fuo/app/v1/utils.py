@@ -1,41 +1,206 @@
+import asyncio
+import base64
+import binascii
+import time
+from collections import OrderedDict
 from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
 
 import discord
-from fastapi import HTTPException, Path
+from anyio import create_task_group
+import sqlalchemy as sa
+from fastapi import Depends, HTTPException, Path
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing_extensions import Annotated
 
+from fuo import config, db, models
 from fuo.bot import bot
 
 
+class UserCache(object):
+    """
+    Bounded TTL cache of discord users resolved by the api.
+    Users which are not found are cached as None for a shorter time.
+    """
+
+    def __init__(
+        self,
+        max_size: int = config.app_user_cache_size,
+        ttl: float = config.app_user_ttl,
+        not_found_ttl: float = config.app_not_found_ttl,
+    ) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._not_found_ttl = not_found_ttl
+
+        # user id -> (user or None if not found, expire at), in LRU order
+        self._entries: OrderedDict[
+            int, Tuple[Optional[discord.abc.Snowflake], float]
+        ] = OrderedDict()
+
+    def get(self, user_id: int) -> Tuple[bool, Optional[discord.abc.Snowflake]]:
+        """Return whether the user is cached, and the cached user."""
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return False, None
+        if entry[1] <= time.monotonic():
+            del self._entries[user_id]
+            return False, None
+
+        self._entries.move_to_end(user_id)
+        return True, entry[0]
+
+    def set(self, user_id: int, user: Optional[discord.abc.Snowflake]):
+        ttl = self._ttl if user is not None else self._not_found_ttl
+        self._entries[user_id] = (user, time.monotonic() + ttl)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+
+user_cache = UserCache()
+
+
+async def _has_scores(user_id: int, sess: AsyncSession) -> bool:
+    q = (
+        sa.select(models.UserScore.id)
+        .where(models.UserScore.member_id == user_id)
+        .limit(1)
+    )
+    return (await sess.execute(q)).first() is not None
+
+
 async def get_user(
     user_id: Annotated[
         int, Path(title="The discord user id", description="The discord user id")
-    ]
-) -> discord.User:
-    user = bot.get_user(user_id)
+    ],
+    sess: Annotated[AsyncSession, Depends(db.get_session)],
+) -> discord.abc.Snowflake:
+    user: Optional[discord.abc.Snowflake] = bot.get_user(user_id)
+    if user is not None:
+        return user
+
+    cached, user = user_cache.get(user_id)
+    if not cached:
+        if config.app_trust_db_users and await _has_scores(user_id, sess):
+            user = discord.Object(id=user_id)
+        else:
+            try:
+                user = await bot.fetch_user(user_id)
+            except discord.errors.NotFound:
+                user = None
+        user_cache.set(user_id, user)
+
     if user is None:
-        try:
-            user = await bot.fetch_user(user_id)
-        except discord.errors.NotFound:
-            raise HTTPException(status_code=422, detail="User not found")
+        raise HTTPException(status_code=422, detail="User not found")
     return user
 
 
-async def get_guild(guild_id: int) -> discord.Guild:
-    guild = bot.get_guild(guild_id)
-    if guild is None:
-        guild = await bot.fetch_guild(guild_id)
-    return guild
+class NameDirectory(object):
+    """
+    TTL cache of names of guilds or channels, shared by all requests.
+
+    Names are taken from the gateway cache of the bot first. Concurrent misses
+    of the same id share one fetch, and ids which are not found are cached too.
+    """
+
+    def __init__(
+        self,
+        get: Callable[[int], Any],
+        fetch: Callable[[int], Awaitable[Any]],
+        ttl: float = config.app_name_ttl,
+        not_found_ttl: float = config.app_not_found_ttl,
+    ) -> None:
+        self._get = get
+        self._fetch = fetch
+        self._ttl = ttl
+        self._not_found_ttl = not_found_ttl
+
+        # id -> (name or None if not found, expire at)
+        self._entries: Dict[int, Tuple[Optional[str], float]] = {}
+        self._fetching: Dict[int, asyncio.Task] = {}
+
+    def set(self, id: int, name: str):
+        self._entries[id] = (name, time.monotonic() + self._ttl)
+
+    async def _fetch_name(self, id: int) -> Optional[str]:
+        try:
+            name: Optional[str] = (await self._fetch(id)).name
+            ttl = self._ttl
+        except (discord.NotFound, discord.Forbidden):
+            name = None
+            ttl = self._not_found_ttl
+        self._entries[id] = (name, time.monotonic() + ttl)
+        return name
+
+    async def get_name(self, id: int) -> Optional[str]:
+        obj = self._get(id)
+        if obj is not None:
+            return obj.name
+
+        entry = self._entries.get(id)
+        if entry is not None and entry[1] > time.monotonic():
+            return entry[0]
+
+        task = self._fetching.get(id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_name(id))
+            self._fetching[id] = task
+            task.add_done_callback(lambda _: self._fetching.pop(id, None))
+        # a cancelled request doesn't cancel the fetch shared with others
+        return await asyncio.shield(task)
+
+    async def get_names(self, ids: Iterable[int]) -> Dict[int, Optional[str]]:
+        names = {}
+
+        async def _set_name(id: int):
+            names[id] = await self.get_name(id)
+
+        async with create_task_group() as tg:
+            for id in set(ids):
+                tg.start_soon(_set_name, id)
+        return names
+
+
+guild_directory = NameDirectory(get=bot.get_guild, fetch=bot.fetch_guild)
+channel_directory = NameDirectory(get=bot.get_channel, fetch=bot.fetch_channel)
+
 
+# names of guilds and channels which the bot leaves are kept until they expire
+@bot.listen("on_guild_update")
+async def _on_guild_update(before: discord.Guild, after: discord.Guild):
+    guild_directory.set(after.id, after.name)
 
-async def get_channel(channel_id: int) -> discord.TextChannel:
-    channel = bot.get_channel(channel_id)
-    if channel is None:
-        channel = await bot.fetch_channel(channel_id)
-    assert isinstance(channel, discord.TextChannel)
-    return channel
+
+@bot.listen("on_guild_remove")
+async def _on_guild_remove(guild: discord.Guild):
+    guild_directory.set(guild.id, guild.name)
+
+
+@bot.listen("on_guild_channel_update")
+async def _on_guild_channel_update(
+    before: discord.abc.GuildChannel, after: discord.abc.GuildChannel
+):
+    channel_directory.set(after.id, after.name)
+
+
+@bot.listen("on_guild_channel_delete")
+async def _on_guild_channel_delete(channel: discord.abc.GuildChannel):
+    channel_directory.set(channel.id, channel.name)
 
 
 class OrderParam(str, Enum):
     ASC = "asc"
     DESC = "desc"
+
+
+def encode_cursor(id: int) -> str:
+    return base64.urlsafe_b64encode(str(id).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        return int(base64.urlsafe_b64decode(cursor + padding).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=422, detail="Invalid cursor")
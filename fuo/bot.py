@@ -29,6 +29,9 @@ async def run_bot():
             await bot.add_cog(cogs.PostCog(bot))
             await bot.add_cog(cogs.QuestionCog(bot))
             await bot.add_cog(cogs.ChatCog(bot))
+            await bot.add_cog(cogs.EmojiCog(bot))
+            await bot.add_cog(cogs.RouterCog(bot))
+            await bot.add_cog(cogs.DbCog(bot))
 
             await bot.start(config.discord_token)
     except KeyboardInterrupt:
@@ -1,8 +1,21 @@
 from .channel_cog import ChannelCog
 from .chat_cog import ChatCog
+from .db_cog import DbCog
+from .emoji_cog import EmojiCog
 from .post_cog import PostCog
 from .question_cog import QuestionCog
 from .role_cog import RoleCog
+from .router_cog import RouterCog
 from .score_cog import ScoreCog
 
-__all__ = ["PostCog", "ScoreCog", "ChannelCog", "QuestionCog", "ChatCog", "RoleCog"]
+__all__ = [
+    "PostCog",
+    "ScoreCog",
+    "ChannelCog",
+    "QuestionCog",
+    "ChatCog",
+    "RoleCog",
+    "RouterCog",
+    "EmojiCog",
+    "DbCog",
+]
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Optional
+from typing import Dict, Optional, Tuple
 
 import discord
 import sqlalchemy as sa
@@ -28,6 +28,21 @@ class ChannelCog(commands.Cog, name="channel"):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self._unique_channel_types = [models.ChannelType.QUESTION]
+        # (guild_id, channel_id) -> channel type of all configured channels
+        self._channel_types: Dict[Tuple[int, int], models.ChannelType] = {}
+
+    async def cog_load(self):
+        async with db.session_scope() as sess:
+            q = sa.select(
+                models.ChannelConfig.guild_id,
+                models.ChannelConfig.channel_id,
+                models.ChannelConfig.channel_type,
+            )
+            self._channel_types = {
+                (guild_id, channel_id): channel_type
+                for guild_id, channel_id, channel_type in await sess.execute(q)
+            }
+        _logger.info(f"load {len(self._channel_types)} channel configs")
 
     def _is_unique_channel(self, channel_type: models.ChannelType) -> bool:
         return channel_type in self._unique_channel_types
@@ -52,6 +67,7 @@ class ChannelCog(commands.Cog, name="channel"):
         guild_id = ctx.guild.id
         channel_id = channel.id
 
+        old_channel_id = None
         async with db.session_scope() as sess:
             # one channel can only have one type
             q = (
@@ -74,6 +90,7 @@ class ChannelCog(commands.Cog, name="channel"):
                 )
                 old_channel_conf = (await sess.execute(q)).scalar_one_or_none()
                 if old_channel_conf is not None:
+                    old_channel_id = old_channel_conf.channel_id
                     old_channel_conf.channel_id = channel_id
                 else:
                     channel_conf = models.ChannelConfig(
@@ -92,6 +109,9 @@ class ChannelCog(commands.Cog, name="channel"):
                 sess.add(channel_conf)
 
             await sess.commit()
+        if old_channel_id is not None:
+            self._channel_types.pop((guild_id, old_channel_id), None)
+        self._channel_types[(guild_id, channel_id)] = channel_type
 
         embed = discord.Embed(
             color=discord.Color.from_str(config.success_color),
@@ -128,6 +148,7 @@ class ChannelCog(commands.Cog, name="channel"):
                 await sess.commit()
             else:
                 raise ChannelTypeNotFound(channel_name=channel.name)
+        self._channel_types.pop((guild_id, channel_id), None)
 
         embed = discord.Embed(
             color=discord.Color.from_str(config.success_color),
@@ -166,19 +187,15 @@ class ChannelCog(commands.Cog, name="channel"):
             else:
                 raise ChannelTypeNotFound(channel_name=channel.name)
 
-    async def check_channel_type(
+    def find_channel_type(
+        self, guild_id: int, channel_id: int
+    ) -> Optional[models.ChannelType]:
+        return self._channel_types.get((guild_id, channel_id))
+
+    def check_channel_type(
         self, guild_id: int, channel_id: int, channel_type: models.ChannelType
     ) -> bool:
-        async with db.session_scope() as sess:
-            q = (
-                sa.select(sa.func.count(models.ChannelConfig.id))
-                .where(models.ChannelConfig.guild_id == guild_id)
-                .where(models.ChannelConfig.channel_id == channel_id)
-                .where(models.ChannelConfig.channel_type == channel_type)
-            )
-
-            count = (await sess.execute(q)).scalar_one()
-            return count > 0
+        return self._channel_types.get((guild_id, channel_id)) == channel_type
 
     async def cog_command_error(self, ctx: commands.Context, error: Exception):
         _logger.error(error)
@@ -0,0 +1,48 @@
+import logging
+
+import discord
+from discord.ext import commands
+
+from fuo import config, db
+
+_logger = logging.getLogger(__name__)
+
+
+class DbCog(commands.Cog, name="db"):
+    """Admin commands about the database."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @commands.command(
+        name="get-db-stats",
+        help="Get the connection pool stats of the database, "
+        "including the histogram of connection wait seconds.",
+    )
+    @commands.has_role(config.discord_role)
+    async def get_db_stats(self, ctx: commands.Context):
+        embed = discord.Embed(
+            color=discord.Color.from_str(config.info_color),
+            title="Get db stats result",
+        )
+        stats = db.pool_stats()
+        wait_buckets = stats.pop("wait_buckets")
+        for name, value in stats.items():
+            embed.add_field(name=name, value=value, inline=True)
+        embed.add_field(
+            name="wait_buckets",
+            value="\n".join(f"{le}: {count}" for le, count in wait_buckets.items()),
+            inline=False,
+        )
+        await ctx.send(embed=embed)
+
+    async def cog_command_error(self, ctx: commands.Context, error: Exception):
+        _logger.error(error)
+        embed = discord.Embed(
+            color=discord.Color.from_str(config.error_color), title="Error!"
+        )
+        if isinstance(error, commands.MissingRole):
+            embed.description = "Sorry, you are not permitted to execute this command."
+        else:
+            embed.description = "Sorry, there's sth wrong with FUO bot."
+        await ctx.send(embed=embed)
@@ -0,0 +1,165 @@
+import logging
+from typing import Optional
+
+import discord
+import emoji as em
+import sqlalchemy as sa
+from discord.ext import commands
+from typing_extensions import Annotated
+
+from fuo import config, db, models, utils
+
+_logger = logging.getLogger(__name__)
+
+
+class ReactionEmojiNotFound(commands.CommandError):
+    def __init__(self, emoji: str):
+        self.emoji = emoji
+        super().__init__()
+
+
+def _parse_emoji(s: str) -> discord.PartialEmoji:
+    emoji = discord.PartialEmoji.from_str(s)
+    if emoji.id is None and not em.is_emoji(emoji.name):
+        raise commands.BadArgument(f"{s} is not a emoji.")
+    return emoji
+
+
+class EmojiCog(commands.Cog, name="emoji"):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self._classifier = utils.EmojiClassifier()
+
+    async def cog_load(self):
+        async with db.session_scope() as sess:
+            q = sa.select(models.ReactionEmoji)
+            reaction_emojis = (await sess.execute(q)).scalars().all()
+        for reaction_emoji in reaction_emojis:
+            self._classifier.set(
+                guild_id=reaction_emoji.guild_id,
+                emoji=reaction_emoji.emoji,
+                emoji_class=reaction_emoji.emoji_class,
+                emoji_id=reaction_emoji.emoji_id,
+            )
+        _logger.info(f"load {len(reaction_emojis)} reaction emojis")
+
+    def classify(
+        self, guild_id: Optional[int], emoji: discord.PartialEmoji
+    ) -> Optional[models.EmojiClass]:
+        return self._classifier.classify(
+            guild_id=guild_id, emoji=emoji.name, emoji_id=emoji.id
+        )
+
+    @commands.command(
+        name="set-reaction-emoji",
+        help="Set the class of a reaction emoji in this guild. "
+        "The emoji can be a unicode emoji or a custom emoji of the guild. "
+        "Emoji class can be LIKE or DISLIKE.",
+    )
+    @commands.has_role(config.discord_role)
+    async def set_reaction_emoji(
+        self,
+        ctx: commands.Context,
+        emoji: Annotated[discord.PartialEmoji, _parse_emoji],
+        emoji_class: Annotated[models.EmojiClass, utils.to_emoji_class],
+    ):
+        assert ctx.guild is not None
+        guild_id = ctx.guild.id
+        if emoji.id is not None:
+            emoji_name = emoji.name
+        else:
+            emoji_name = utils.normalize_emoji(emoji.name)
+
+        async with db.session_scope() as sess:
+            q = sa.select(models.ReactionEmoji).where(
+                models.ReactionEmoji.guild_id == guild_id
+            )
+            if emoji.id is not None:
+                q = q.where(models.ReactionEmoji.emoji_id == emoji.id)
+            else:
+                q = q.where(models.ReactionEmoji.emoji == emoji_name)
+            reaction_emoji = (await sess.execute(q)).scalar_one_or_none()
+            if reaction_emoji is not None:
+                reaction_emoji.emoji_class = emoji_class
+            else:
+                reaction_emoji = models.ReactionEmoji(
+                    guild_id=guild_id,
+                    emoji=emoji_name,
+                    emoji_class=emoji_class,
+                    emoji_id=emoji.id,
+                )
+                sess.add(reaction_emoji)
+            await sess.commit()
+
+        # update local emoji classifier
+        self._classifier.set(
+            guild_id=guild_id,
+            emoji=emoji_name,
+            emoji_class=emoji_class,
+            emoji_id=emoji.id,
+        )
+
+        embed = discord.Embed(
+            color=discord.Color.from_str(config.success_color),
+            title="Set reaction emoji successfully",
+        )
+        embed.add_field(name="Emoji", value=str(emoji), inline=True)
+        embed.add_field(name="Class", value=emoji_class.name, inline=True)
+        await ctx.send(embed=embed)
+
+    @commands.command(
+        name="remove-reaction-emoji",
+        help="Remove a reaction emoji set in this guild.",
+    )
+    @commands.has_role(config.discord_role)
+    async def remove_reaction_emoji(
+        self,
+        ctx: commands.Context,
+        emoji: Annotated[discord.PartialEmoji, _parse_emoji],
+    ):
+        assert ctx.guild is not None
+        guild_id = ctx.guild.id
+        if emoji.id is not None:
+            emoji_name = emoji.name
+        else:
+            emoji_name = utils.normalize_emoji(emoji.name)
+
+        async with db.session_scope() as sess:
+            q = sa.select(models.ReactionEmoji).where(
+                models.ReactionEmoji.guild_id == guild_id
+            )
+            if emoji.id is not None:
+                q = q.where(models.ReactionEmoji.emoji_id == emoji.id)
+            else:
+                q = q.where(models.ReactionEmoji.emoji == emoji_name)
+            reaction_emoji = (await sess.execute(q)).scalar_one_or_none()
+            if reaction_emoji is not None:
+                await sess.delete(reaction_emoji)
+                await sess.commit()
+            else:
+                raise ReactionEmojiNotFound(emoji=str(emoji))
+
+        # update local emoji classifier
+        self._classifier.remove(guild_id=guild_id, emoji=emoji_name, emoji_id=emoji.id)
+
+        embed = discord.Embed(
+            color=discord.Color.from_str(config.success_color),
+            title="Remove reaction emoji successfully",
+        )
+        embed.add_field(name="Emoji", value=str(emoji), inline=True)
+        await ctx.send(embed=embed)
+
+    async def cog_command_error(self, ctx: commands.Context, error: Exception):
+        _logger.error(error)
+        embed = discord.Embed(
+            color=discord.Color.from_str(config.error_color), title="Error!"
+        )
+        if isinstance(error, commands.MissingRole):
+            embed.description = "Sorry, you are not permitted to execute this command."
+        elif isinstance(error, commands.BadArgument):
+            embed.description = f"Sorry, {str(error)}"
+        elif isinstance(error, ReactionEmojiNotFound):
+            embed.description = f"Emoji {error.emoji} is not set in this guild."
+        else:
+            embed.description = "Sorry, there's sth wrong with FUO bot."
+        await ctx.send(embed=embed)
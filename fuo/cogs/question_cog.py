@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
 
 import discord
 import sqlalchemy as sa
 from discord.ext import commands
+from sqlalchemy.ext.asyncio import AsyncSession
 from tabulate import tabulate
 
-from fuo import config, db, models, utils
+from fuo import config, db, models
+from fuo.score import answer_reaction_buffer
 
 from .channel_cog import ChannelCog
 from .score_cog import ScoreCog
@@ -28,15 +31,81 @@ class QuestionMissing(commands.CommandError):
     pass
 
 
-async def question_summary(guild: discord.Guild, question: models.Question) -> discord.Embed:
+# discord limits of an embed field value and of a whole embed
+_FIELD_VALUE_LIMIT = 1024
+_EMBED_LIMIT = 6000
+_EMBED_FIELDS_LIMIT = 25
+# gateway member queries accept at most 100 user ids
+_QUERY_MEMBERS_LIMIT = 100
+
+
+async def resolve_members(
+    guild: discord.Guild, member_ids: Iterable[int]
+) -> Dict[int, discord.Member]:
+    members = {}
+    missing = []
+    for member_id in set(member_ids):
+        member = guild.get_member(member_id)
+        if member is not None:
+            members[member_id] = member
+        else:
+            missing.append(member_id)
+
+    # members not in the cache are queried over the gateway in chunks,
+    # and cached for the following summaries
+    for i in range(0, len(missing), _QUERY_MEMBERS_LIMIT):
+        user_ids = missing[i : i + _QUERY_MEMBERS_LIMIT]
+        try:
+            queried = await guild.query_members(
+                user_ids=user_ids, limit=_QUERY_MEMBERS_LIMIT, cache=True
+            )
+        except asyncio.TimeoutError:
+            _logger.error(f"query members of guild {guild.id} timeout")
+            continue
+        except (discord.HTTPException, discord.ClientException) as e:
+            # the question is closed already, its summary just lacks these rows
+            _logger.error(f"query members of guild {guild.id} failed: {e}")
+            continue
+        for member in queried:
+            members[member.id] = member
+
+    return members
+
+
+def _render_table(rows: List[Dict[str, Any]]) -> str:
+    return f"```{tabulate(rows, headers='keys', tablefmt='pretty')}```"
+
+
+def _render_tables(rows: List[Dict[str, Any]]) -> List[str]:
+    """Render rows into tables which fit in embed field values."""
+    tables = []
+    chunk: List[Dict[str, Any]] = []
+    table = _render_table(chunk)
+    for row in rows:
+        new_table = _render_table(chunk + [row])
+        if len(new_table) > _FIELD_VALUE_LIMIT and len(chunk) > 0:
+            tables.append(table)
+            chunk = [row]
+            table = _render_table(chunk)
+        else:
+            chunk.append(row)
+            table = new_table
+    tables.append(table)
+    return tables
+
+
+async def question_summary(
+    guild: discord.Guild, question: models.Question
+) -> List[discord.Embed]:
+    members = await resolve_members(
+        guild, (answer.member_id for answer in question.answers)
+    )
+
     rows = []
     for answer in question.answers:
-        member = guild.get_member(answer.member_id)
+        member = members.get(answer.member_id)
         if member is None:
-            try:
-                member = await guild.fetch_member(answer.member_id)
-            except discord.errors.NotFound:
-                continue
+            continue
 
         rows.append(
             {
@@ -46,21 +115,104 @@ async def question_summary(guild: discord.Guild, question: models.Question) -> d
             }
         )
 
-    table = tabulate(rows, headers="keys", tablefmt="pretty")
+    tables = _render_tables(rows)
 
     embed = discord.Embed(
         color=discord.Color.from_str(config.info_color),
         title="Close the question successfully.",
     )
     embed.add_field(name="Answers count", value=len(question.answers), inline=False)
-    embed.add_field(name="Answers detail", value=f"```{table}```", inline=False)
+    embeds = [embed]
+    for i, table in enumerate(tables):
+        name = "Answers detail"
+        if len(tables) > 1:
+            name += f" ({i + 1}/{len(tables)})"
+        if (
+            len(embed.fields) >= _EMBED_FIELDS_LIMIT
+            or len(embed) + len(name) + len(table) > _EMBED_LIMIT
+        ):
+            embed = discord.Embed(color=discord.Color.from_str(config.info_color))
+            embeds.append(embed)
+        embed.add_field(name=name, value=table, inline=False)
+
+    return embeds
+
 
-    return embed
+class OpenQuestion(NamedTuple):
+    id: int
+    member_id: int
 
 
 class QuestionCog(commands.Cog, name="question"):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        # (guild_id, channel_id) -> open question, None if the last one is closed
+        self._open_questions: Dict[Tuple[int, int], Optional[OpenQuestion]] = {}
+        # (guild_id, channel_id) -> message ids of answers to the open question
+        self._answer_messages: Dict[Tuple[int, int], Set[int]] = {}
+
+    async def cog_load(self):
+        async with db.session_scope() as sess:
+            q = sa.select(
+                models.Question.guild_id,
+                models.Question.channel_id,
+                models.Question.id,
+                models.Question.member_id,
+            )
+            q = q.where(models.Question.opened == sa.true()).order_by(
+                models.Question.id
+            )
+            # the latest open question of a channel wins, as in _get_open_question
+            for guild_id, channel_id, id, member_id in await sess.execute(q):
+                self._open_questions[(guild_id, channel_id)] = OpenQuestion(
+                    id=id, member_id=member_id
+                )
+
+            q = (
+                sa.select(
+                    models.Answer.guild_id,
+                    models.Answer.channel_id,
+                    models.Answer.question_id,
+                    models.Answer.message_id,
+                )
+                .join(models.Question, models.Answer.question_id == models.Question.id)
+                .where(models.Question.opened == sa.true())
+            )
+            for guild_id, channel_id, question_id, message_id in await sess.execute(q):
+                open_question = self._open_questions.get((guild_id, channel_id))
+                if open_question is None or open_question.id != question_id:
+                    continue
+                self._answer_messages.setdefault((guild_id, channel_id), set()).add(
+                    message_id
+                )
+        _logger.info(f"load {len(self._open_questions)} open questions")
+
+    async def _get_open_question(
+        self, guild_id: int, channel_id: int, *, sess: AsyncSession
+    ) -> OpenQuestion:
+        key = (guild_id, channel_id)
+        if key not in self._open_questions:
+            # channels without open questions are only looked up once
+            q = (
+                sa.select(models.Question)
+                .where(models.Question.guild_id == guild_id)
+                .where(models.Question.channel_id == channel_id)
+                .order_by(sa.desc(models.Question.id))
+                .limit(1)
+            )
+            question = (await sess.execute(q)).scalars().first()
+            if question is None:
+                raise QuestionMissing
+            self._open_questions[key] = (
+                OpenQuestion(id=question.id, member_id=question.member_id)
+                if question.opened
+                else None
+            )
+
+        open_question = self._open_questions[key]
+        if open_question is None:
+            raise QuestionFinished
+        return open_question
 
     def _get_score_cog(self) -> ScoreCog:
         score_cog = self.bot.get_cog("score")
@@ -74,9 +226,9 @@ class QuestionCog(commands.Cog, name="question"):
         assert isinstance(channel_cog, ChannelCog)
         return channel_cog
 
-    async def in_question_channel(self, guild_id: int, channel_id: int) -> bool:
+    def in_question_channel(self, guild_id: int, channel_id: int) -> bool:
         channel_cog = self._get_channel_cog()
-        return await channel_cog.check_channel_type(
+        return channel_cog.check_channel_type(
             guild_id=guild_id,
             channel_id=channel_id,
             channel_type=models.ChannelType.QUESTION,
@@ -86,7 +238,7 @@ class QuestionCog(commands.Cog, name="question"):
         if ctx.guild is not None:
             guild_id = ctx.guild.id
             channel_id = ctx.channel.id
-            return await self.in_question_channel(
+            return self.in_question_channel(
                 guild_id=guild_id, channel_id=channel_id
             )
         else:
@@ -103,16 +255,11 @@ class QuestionCog(commands.Cog, name="question"):
         member_id = ctx.author.id
 
         async with db.session_scope() as sess:
-            q = (
-                sa.select(models.Question)
-                .where(models.Question.guild_id == guild_id)
-                .where(models.Question.channel_id == channel_id)
-                .order_by(sa.desc(models.Question.id))
-                .limit(1)
-            )
-
-            last_question = (await sess.execute(q)).scalars().first()
-            if last_question is not None and last_question.opened:
+            try:
+                await self._get_open_question(guild_id, channel_id, sess=sess)
+            except (QuestionMissing, QuestionFinished):
+                pass
+            else:
                 raise QuestionNotFinished
 
             question = models.Question(
@@ -122,6 +269,9 @@ class QuestionCog(commands.Cog, name="question"):
             )
             sess.add(question)
             await sess.commit()
+        self._open_questions[(guild_id, channel_id)] = OpenQuestion(
+            id=question.id, member_id=member_id
+        )
 
         embed = discord.Embed(
             color=discord.Color.from_str(config.success_color),
@@ -159,19 +309,7 @@ class QuestionCog(commands.Cog, name="question"):
         member_id = ctx.author.id
 
         async with db.session_scope() as sess:
-            q = (
-                sa.select(models.Question)
-                .where(models.Question.guild_id == guild_id)
-                .where(models.Question.channel_id == channel_id)
-                .order_by(sa.desc(models.Question.id))
-                .limit(1)
-            )
-
-            question = (await sess.execute(q)).scalars().first()
-            if question is None:
-                raise QuestionMissing
-            if not question.opened:
-                raise QuestionFinished
+            question = await self._get_open_question(guild_id, channel_id, sess=sess)
             question_author = self.bot.get_user(question.member_id)
 
             answer = models.Answer(
@@ -181,9 +319,11 @@ class QuestionCog(commands.Cog, name="question"):
                 question_id=question.id,
                 message_id=ctx.message.id,
             )
-            models.question = question
             sess.add(answer)
             await sess.commit()
+        self._answer_messages.setdefault((guild_id, channel_id), set()).add(
+            ctx.message.id
+        )
 
         embed = discord.Embed(
             color=discord.Color.from_str(config.success_color),
@@ -227,51 +367,50 @@ class QuestionCog(commands.Cog, name="question"):
         guild_id = ctx.guild.id
         channel_id = ctx.channel.id
 
-        async with db.session_scope() as sess:
-            q = (
-                sa.select(models.Question)
-                .where(models.Question.guild_id == guild_id)
-                .where(models.Question.channel_id == channel_id)
-                .order_by(sa.desc(models.Question.id))
-                .limit(1)
-            )
-
-            question = (await sess.execute(q)).scalars().first()
-            if question is None:
-                raise QuestionMissing
-            if not question.opened:
-                raise QuestionFinished
+        key = (guild_id, channel_id)
+        # reactions on the answers are not counted any more, so the flush below
+        # makes like and dislike counts final before they are scored
+        answer_messages = self._answer_messages.pop(key, None)
+        try:
+            await answer_reaction_buffer.flush()
 
-            await sess.refresh(question, ["answers"])
-            question.answers.sort(key=lambda answer: answer.like, reverse=True)
+            async with db.session_scope() as sess:
+                open_question = await self._get_open_question(
+                    guild_id, channel_id, sess=sess
+                )
+                question = await sess.get(models.Question, open_question.id)
+                assert question is not None
 
-            summary = await question_summary(ctx.guild, question)
+                await sess.refresh(question, ["answers"])
+                question.answers.sort(key=lambda answer: answer.like, reverse=True)
 
-            question.opened = False
+                question.opened = False
 
-            score_cog = self._get_score_cog()
-            await score_cog.question_score(
-                guild_id=guild_id,
-                channel_id=channel_id,
-                member_id=question.member_id,
-                sess=sess,
-            )
-            futs = []
-            for answer in question.answers:
-                fut = score_cog.answer_score(
+                score_cog = self._get_score_cog()
+                awards = await score_cog.award_question(
                     guild_id=guild_id,
                     channel_id=channel_id,
-                    member_id=answer.member_id,
-                    like=answer.like,
-                    dislike=answer.dislike,
+                    question=question,
                     sess=sess,
                 )
-                futs.append(fut)
-            await asyncio.wait(futs)
 
-            await sess.commit()
+                await sess.commit()
+        except BaseException:
+            # the question is still open, keep counting reactions on its answers
+            if answer_messages is not None:
+                self._answer_messages.setdefault(key, set()).update(answer_messages)
+            raise
+
+        score_cog.apply_awards(awards)
+        self._open_questions[key] = None
+        # answers added while closing are not counted either
+        self._answer_messages.pop(key, None)
 
-        await ctx.send(embed=summary)
+        # members are resolved after the transaction, which is not held meanwhile
+        summary = await question_summary(ctx.guild, question)
+        # an embed can be as large as a whole message
+        for embed in summary:
+            await ctx.send(embed=embed)
 
     @close_question.error
     async def close_question_error(self, ctx: commands.Context, error: Exception):
@@ -293,38 +432,43 @@ class QuestionCog(commands.Cog, name="question"):
             embed.description = "Sorry, there's sth wrong with FUO bot."
         await ctx.send(embed=embed)
 
-    @commands.Cog.listener(name="on_raw_reaction_add")
-    async def reaction_on_answer(self, payload: discord.RawReactionActionEvent):
-        try:
-            assert payload.member is not None
-            assert payload.guild_id is not None
-            emoji = payload.emoji.name
-            if not utils.is_valid_emoji(emoji):
-                return
-
-            if await self.in_question_channel(
-                guild_id=payload.guild_id, channel_id=payload.channel_id
-            ):
-                async with db.session_scope() as sess:
-                    q = (
-                        sa.select(models.Answer)
-                        .where(models.Answer.guild_id == payload.guild_id)
-                        .where(models.Answer.channel_id == payload.channel_id)
-                        .where(models.Answer.message_id == payload.message_id)
-                    )
-
-                    answer = (await sess.execute(q)).scalar_one_or_none()
-                    if answer is not None:
-                        if utils.is_like_emoji(emoji):
-                            answer.like += 1
-                            _logger.info(f"answer {payload.message_id} has been liked")
-                        elif utils.is_dislike_emoji(emoji):
-                            answer.dislike += 1
-                            _logger.info(
-                                f"answer {payload.message_id} has been disliked"
-                            )
-
-                        await sess.commit()
-        except Exception as e:
-            _logger.error(e)
-            raise
+    async def reaction_on_answer(
+        self, payload: discord.RawReactionActionEvent, emoji_class: models.EmojiClass
+    ):
+        """Handle a reaction in the QUESTION channel, routed by RouterCog."""
+        self._count_answer_reaction(payload, emoji_class, 1)
+
+    async def reaction_removed_on_answer(
+        self, payload: discord.RawReactionActionEvent, emoji_class: models.EmojiClass
+    ):
+        """Handle a reaction removal in the QUESTION channel, routed by RouterCog."""
+        self._count_answer_reaction(payload, emoji_class, -1)
+
+    def _count_answer_reaction(
+        self,
+        payload: discord.RawReactionActionEvent,
+        emoji_class: models.EmojiClass,
+        delta: int,
+    ):
+        assert payload.guild_id is not None
+
+        answer_messages = self._answer_messages.get(
+            (payload.guild_id, payload.channel_id)
+        )
+        if answer_messages is None or payload.message_id not in answer_messages:
+            return
+
+        if emoji_class == models.EmojiClass.LIKE:
+            answer_reaction_buffer.add(
+                guild_id=payload.guild_id,
+                channel_id=payload.channel_id,
+                message_id=payload.message_id,
+                like=delta,
+            )
+        elif emoji_class == models.EmojiClass.DISLIKE:
+            answer_reaction_buffer.add(
+                guild_id=payload.guild_id,
+                channel_id=payload.channel_id,
+                message_id=payload.message_id,
+                dislike=delta,
+            )
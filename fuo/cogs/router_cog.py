@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from typing import Dict
+
+import discord
+from discord.ext import commands
+
+from fuo import config, models, utils
+
+from .channel_cog import ChannelCog
+from .chat_cog import ChatCog
+from .emoji_cog import EmojiCog
+from .post_cog import PostCog
+from .question_cog import QuestionCog
+
+_logger = logging.getLogger(__name__)
+
+
+class RouterCog(commands.Cog, name="router"):
+    """
+    Single entry of message and reaction events.
+
+    Every event is classified once by channel type, emoji class and whether
+    it is a command, then dispatched to the only cog which handles it.
+    """
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self._counters: Counter[str] = Counter()
+
+    @property
+    def counters(self) -> Dict[str, int]:
+        return dict(self._counters)
+
+    def _get_cog(self, name: str):
+        cog = self.bot.get_cog(name)
+        assert cog is not None
+        return cog
+
+    def _find_channel_type(self, guild_id: int, channel_id: int):
+        channel_cog = self._get_cog("channel")
+        assert isinstance(channel_cog, ChannelCog)
+        return channel_cog.find_channel_type(guild_id=guild_id, channel_id=channel_id)
+
+    @commands.Cog.listener(name="on_message")
+    async def route_message(self, message: discord.Message):
+        if message.guild is None or utils.is_bot(self.bot, message):
+            self._counters["message.ignored"] += 1
+            return
+
+        channel_type = self._find_channel_type(
+            guild_id=message.guild.id, channel_id=message.channel.id
+        )
+        if channel_type is None:
+            self._counters["message.unconfigured"] += 1
+            return
+        if channel_type == models.ChannelType.QUESTION:
+            # questions and answers are commands handled by the question cog
+            self._counters["message.question"] += 1
+            return
+        if await utils.is_command(self.bot, message):
+            self._counters["message.command"] += 1
+            return
+
+        if channel_type == models.ChannelType.POST:
+            self._counters["message.post"] += 1
+            post_cog = self._get_cog("post")
+            assert isinstance(post_cog, PostCog)
+            await post_cog.post_message(message)
+        elif channel_type == models.ChannelType.CHAT:
+            self._counters["message.chat"] += 1
+            chat_cog = self._get_cog("chat")
+            assert isinstance(chat_cog, ChatCog)
+            await chat_cog.chat_message(message)
+
+    @commands.Cog.listener(name="on_raw_reaction_add")
+    async def route_reaction(self, payload: discord.RawReactionActionEvent):
+        if payload.guild_id is None or payload.member is None:
+            self._counters["reaction.ignored"] += 1
+            return
+
+        channel_type = self._find_channel_type(
+            guild_id=payload.guild_id, channel_id=payload.channel_id
+        )
+        if channel_type is None:
+            self._counters["reaction.unconfigured"] += 1
+            return
+        emoji_cog = self._get_cog("emoji")
+        assert isinstance(emoji_cog, EmojiCog)
+        emoji_class = emoji_cog.classify(guild_id=payload.guild_id, emoji=payload.emoji)
+        if emoji_class is None:
+            self._counters["reaction.ignored"] += 1
+            return
+
+        if channel_type == models.ChannelType.POST:
+            self._counters["reaction.post"] += 1
+            post_cog = self._get_cog("post")
+            assert isinstance(post_cog, PostCog)
+            await post_cog.reaction_on_post(payload)
+        elif channel_type == models.ChannelType.QUESTION:
+            self._counters["reaction.question"] += 1
+            question_cog = self._get_cog("question")
+            assert isinstance(question_cog, QuestionCog)
+            await question_cog.reaction_on_answer(payload, emoji_class)
+        elif channel_type == models.ChannelType.CHAT:
+            self._counters["reaction.chat"] += 1
+            chat_cog = self._get_cog("chat")
+            assert isinstance(chat_cog, ChatCog)
+            await chat_cog.reaction_on_chat(payload)
+
+    @commands.Cog.listener(name="on_raw_reaction_remove")
+    async def route_reaction_removal(self, payload: discord.RawReactionActionEvent):
+        if payload.guild_id is None:
+            self._counters["reaction_remove.ignored"] += 1
+            return
+
+        channel_type = self._find_channel_type(
+            guild_id=payload.guild_id, channel_id=payload.channel_id
+        )
+        if channel_type != models.ChannelType.QUESTION:
+            # only reactions on answers are counted, scores are never taken back
+            self._counters["reaction_remove.ignored"] += 1
+            return
+        emoji_cog = self._get_cog("emoji")
+        assert isinstance(emoji_cog, EmojiCog)
+        emoji_class = emoji_cog.classify(guild_id=payload.guild_id, emoji=payload.emoji)
+        if emoji_class is None:
+            self._counters["reaction_remove.ignored"] += 1
+            return
+
+        self._counters["reaction_remove.question"] += 1
+        question_cog = self._get_cog("question")
+        assert isinstance(question_cog, QuestionCog)
+        await question_cog.reaction_removed_on_answer(payload, emoji_class)
+
+    @commands.command(
+        name="get-route-stats",
+        help="Get the count of message and reaction events of every route.",
+    )
+    @commands.has_role(config.discord_role)
+    async def get_route_stats(self, ctx: commands.Context):
+        embed = discord.Embed(
+            color=discord.Color.from_str(config.info_color),
+            title="Get route stats result",
+        )
+        for route, count in sorted(self._counters.items()):
+            embed.add_field(name=route, value=count, inline=True)
+        await ctx.send(embed=embed)
+
+    async def cog_command_error(self, ctx: commands.Context, error: Exception):
+        _logger.error(error)
+        embed = discord.Embed(
+            color=discord.Color.from_str(config.error_color), title="Error!"
+        )
+        if isinstance(error, commands.MissingRole):
+            embed.description = "Sorry, you are not permitted to execute this command."
+        else:
+            embed.description = "Sorry, there's sth wrong with FUO bot."
+        await ctx.send(embed=embed)
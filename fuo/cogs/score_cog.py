@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 import logging
-import time
-from collections import defaultdict
-from typing import DefaultDict, Optional, Tuple
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Set
 
 import discord
 import sqlalchemy as sa
@@ -13,10 +12,37 @@ from typing_extensions import Annotated
 import emoji as em
 
 from fuo import config, db, models, utils
+from fuo.score import (
+    CooldownIndex,
+    ScoreConfigResolver,
+    ScoreEvent,
+    ScoreLogKey,
+    UserScoreKey,
+    get_member_score,
+    increment_user_scores,
+    insert_score_logs,
+    new_score_log,
+    leaderboard,
+    score_buffer,
+    score_events,
+)
 
 _logger = logging.getLogger(__name__)
 
 
+class Award(NamedTuple):
+    score_src: models.ScoreSource
+    guild_id: int
+    channel_id: int
+    member_id: int
+    score: float
+    cooldown: int
+
+
+# most members listed by the top command
+MAX_TOP_COUNT = 25
+
+
 class ScoreCog(commands.Cog, name="score"):
     DEFAULT_ACTION_SCORE = 1.0
     DEFAULT_ACTION_COOLDOWN = 0
@@ -25,150 +51,34 @@ class ScoreCog(commands.Cog, name="score"):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
-        self._action_scores: DefaultDict[
-            models.ScoreSource, DefaultDict[int | Tuple[int, int], float]
-        ] = defaultdict(lambda: defaultdict(lambda: self.DEFAULT_ACTION_SCORE))
-        self._action_cooldowns: DefaultDict[
-            models.ScoreSource, DefaultDict[int | Tuple[int, int], int]
-        ] = defaultdict(lambda: defaultdict(lambda: self.DEFAULT_ACTION_COOLDOWN))
+        self._configs = ScoreConfigResolver(
+            default_score=self.DEFAULT_ACTION_SCORE,
+            default_cooldown=self.DEFAULT_ACTION_COOLDOWN,
+        )
         self._symbol: str | None = None
+        self._cooldowns = CooldownIndex()
 
-    async def _get_action_score(
-        self,
-        score_src: models.ScoreSource,
-        guild_id: int,
-        channel_id: Optional[int] = None,
-        *,
-        sess: AsyncSession | None = None,
-    ) -> float:
-        assert sess is not None
-
-        score_config = self._action_scores[score_src]
-        if channel_id is None:
-            score_key = guild_id
-        else:
-            score_key = (guild_id, channel_id)
-
-        # first find config for the specific score source and channel,
-        # then find config for the specific score source only,
-        if score_key in score_config:
-            score = score_config[score_key]
-        elif guild_id in score_config:
-            score = score_config[guild_id]
-        else:
-            conf = None
-            if channel_id is not None:
-                q = (
-                    sa.select(models.ScoreConfig)
-                    .where(models.ScoreConfig.guild_id == guild_id)
-                    .where(models.ScoreConfig.score_src == score_src)
-                    .where(models.ScoreConfig.channel_id == channel_id)
-                )
-                conf = (await sess.execute(q)).scalar_one_or_none()
-            if conf is not None:
-                score = conf.score
-                score_config[score_key] = score
-            else:
-                q = (
-                    sa.select(models.ScoreConfig)
-                    .where(models.ScoreConfig.guild_id == guild_id)
-                    .where(models.ScoreConfig.score_src == score_src)
-                )
-                conf = (await sess.execute(q)).scalar_one_or_none()
-                if conf is not None:
-                    score = conf.score
-                    score_config[guild_id] = score
-                else:
-                    score = score_config[score_key]
-
-        return score
-
-    async def _get_action_cooldown(
-        self,
-        score_src: models.ScoreSource,
-        guild_id: int,
-        channel_id: Optional[int] = None,
-        *,
-        sess: AsyncSession | None = None,
-    ):
-        assert sess is not None
-
-        cooldown_config = self._action_cooldowns[score_src]
-        if channel_id is not None:
-            key = (guild_id, channel_id)
-        else:
-            key = guild_id
-
-        if key in cooldown_config:
-            cooldown = cooldown_config[key]
-        elif guild_id in cooldown_config:
-            cooldown = cooldown_config[guild_id]
-        else:
-            conf = None
-            if channel_id is not None:
-                q = (
-                    sa.select(models.ScoreConfig)
-                    .where(models.ScoreConfig.guild_id == guild_id)
-                    .where(models.ScoreConfig.score_src == score_src)
-                    .where(models.ScoreConfig.channel_id == channel_id)
-                )
-                conf = (await sess.execute(q)).scalar_one_or_none()
-            if conf is not None:
-                cooldown = conf.cooldown or 0
-                cooldown_config[key] = cooldown
-            else:
-                q = (
-                    sa.select(models.ScoreConfig)
-                    .where(models.ScoreConfig.guild_id == guild_id)
-                    .where(models.ScoreConfig.score_src == score_src)
-                )
-                conf = (await sess.execute(q)).scalar_one_or_none()
-                if conf is not None:
-                    cooldown = conf.cooldown or 0
-                    cooldown_config[guild_id] = cooldown
-                else:
-                    cooldown = 0
-
-        return cooldown
+    async def cog_load(self):
+        async with db.session_scope() as sess:
+            await self._configs.load(sess)
+            await self._cooldowns.warm(
+                sess, max_cooldown=self._configs.max_cooldown()
+            )
+            await leaderboard.load(sess)
 
-    @db.use_session
-    async def _check_score_cooldown(
+    def _check_score_cooldown(
         self,
         guild_id: int,
         channel_id: int,
         member_id: int,
         score_src: models.ScoreSource,
-        score: float,
-        *,
-        sess: AsyncSession | None = None,
+        cooldown: int,
     ) -> bool:
-        assert sess is not None
-        q = (
-            sa.select(models.ScoreLog)
-            .where(models.ScoreLog.guild_id == guild_id)
-            .where(models.ScoreLog.channel_id == channel_id)
-            .where(models.ScoreLog.member_id == member_id)
-            .where(models.ScoreLog.score_src == score_src)
-            .order_by(sa.desc(models.ScoreLog.id))
-            .limit(1)
-        )
-        log = (await sess.execute(q)).scalars().first()
-        if log is not None:
-            cooldown = await self._get_action_cooldown(
-                score_src=score_src, guild_id=guild_id, channel_id=channel_id, sess=sess
-            )
-            if time.time() < log.created_at.timestamp() + cooldown:
-                return False
+        key = (guild_id, channel_id, member_id, score_src)
+        if self._cooldowns.in_cooldown(key, cooldown):
+            return False
 
-        newLog = models.ScoreLog(
-            guild_id=guild_id,
-            channel_id=channel_id,
-            member_id=member_id,
-            score_src=score_src,
-            score=score,
-        )
-        sess.add(newLog)
-        await sess.commit()
+        self._cooldowns.record(key, cooldown)
         return True
 
     @db.use_session
@@ -182,270 +92,213 @@ class ScoreCog(commands.Cog, name="score"):
         sess: AsyncSession | None = None,
     ):
         assert sess is not None
-        q = (
-            sa.select(models.UserScore)
-            .where(models.UserScore.guild_id == guild_id)
-            .where(models.UserScore.member_id == member_id)
-            .where(models.UserScore.score_type == score_type)
-        )
-        record = (await sess.execute(q)).scalar_one_or_none()
-        if record is not None:
-            record.score += score
-        else:
-            record = models.UserScore(
-                guild_id=guild_id,
-                member_id=member_id,
-                score=score,
-                score_type=score_type,
-            )
-            sess.add(record)
+        await increment_user_scores(sess, {(guild_id, member_id, score_type): score})
         await sess.commit()
 
-    @db.use_session
-    async def post_score(
+    def _compute_award(
         self,
+        score_src: models.ScoreSource,
         guild_id: int,
         channel_id: int,
         member_id: int,
-        *,
-        sess: AsyncSession | None = None,
-    ):
-        assert sess is not None
-
-        score = await self._get_action_score(
-            guild_id=guild_id,
-            channel_id=channel_id,
-            score_src=models.ScoreSource.POST,
-            sess=sess,
+        multiplier: float = 1,
+    ) -> Optional[float]:
+        """Score of the award, or None if the action is in cooldown."""
+        conf = self._configs.resolve(
+            score_src=score_src, guild_id=guild_id, channel_id=channel_id
         )
-        if await self._check_score_cooldown(
+        if not self._check_score_cooldown(
             guild_id=guild_id,
             channel_id=channel_id,
             member_id=member_id,
-            score_src=models.ScoreSource.POST,
-            score=score,
-            sess=sess,
+            score_src=score_src,
+            cooldown=conf.cooldown,
         ):
-            await self._add_member_score(
-                guild_id=guild_id,
-                member_id=member_id,
-                score=score,
-                score_type=models.ScoreType.POST,
-                sess=sess,
-            )
-            _logger.info(f"add {score} post score to member {member_id}")
-        else:
-            _logger.info(f"member {member_id} post score is in cooldown")
+            src_name = score_src.value.replace("_", " ")
+            _logger.info(f"member {member_id} {src_name} score is in cooldown")
+            return None
+        return conf.score * multiplier
 
-    @db.use_session
-    async def post_reaction_score(
+    def _rank_award(
         self,
+        score_src: models.ScoreSource,
         guild_id: int,
-        channel_id: int,
         member_id: int,
-        *,
-        sess: AsyncSession | None = None,
+        score: float,
     ):
-        assert sess is not None
-
-        score = await self._get_action_score(
+        leaderboard.add(
             guild_id=guild_id,
-            channel_id=channel_id,
-            score_src=models.ScoreSource.POST_REACTION,
-            sess=sess,
-        )
-        if await self._check_score_cooldown(
-            guild_id=guild_id,
-            channel_id=channel_id,
             member_id=member_id,
-            score_src=models.ScoreSource.POST_REACTION,
+            score_type=score_src.score_type,
             score=score,
-            sess=sess,
-        ):
-            await self._add_member_score(
-                guild_id=guild_id,
-                member_id=member_id,
-                score=score,
-                score_type=models.ScoreType.POST,
-                sess=sess,
-            )
-            _logger.info(f"add {score} post reaction score to member {member_id}")
-        else:
-            _logger.info(f"member {member_id} post reaction score is in cooldown")
+        )
 
-    @db.use_session
-    async def chat_score(
+    def _publish_award(
         self,
+        score_src: models.ScoreSource,
         guild_id: int,
         channel_id: int,
         member_id: int,
-        *,
-        sess: AsyncSession | None = None,
+        score: float,
     ):
-        assert sess is not None
-
-        score = await self._get_action_score(
-            guild_id=guild_id,
-            channel_id=channel_id,
-            score_src=models.ScoreSource.CHAT,
-            sess=sess,
-        )
-        if await self._check_score_cooldown(
-            guild_id=guild_id,
-            channel_id=channel_id,
-            member_id=member_id,
-            score_src=models.ScoreSource.CHAT,
-            score=score,
-            sess=sess,
-        ):
-            await self._add_member_score(
+        score_events.publish(
+            ScoreEvent(
                 guild_id=guild_id,
+                channel_id=channel_id,
                 member_id=member_id,
+                score_src=score_src,
+                score_type=score_src.score_type,
                 score=score,
-                score_type=models.ScoreType.CHAT,
-                sess=sess,
+                created_at=datetime.now(),
             )
-            _logger.info(f"add {score} chat score to member {member_id}")
-        else:
-            _logger.info(f"member {member_id} chat score is in cooldown")
+        )
 
-    @db.use_session
-    async def chat_reaction_score(
+    async def award(
         self,
+        score_src: models.ScoreSource,
         guild_id: int,
         channel_id: int,
         member_id: int,
-        *,
-        sess: AsyncSession | None = None,
-    ):
-        assert sess is not None
-
-        score = await self._get_action_score(
+        multiplier: float = 1,
+    ) -> bool:
+        """
+        Award the member the configured score of the action, unless the action
+        is in cooldown. The award is written by the score buffer.
+        """
+        score = self._compute_award(
+            score_src=score_src,
             guild_id=guild_id,
             channel_id=channel_id,
-            score_src=models.ScoreSource.CHAT_REACTION,
-            sess=sess,
+            member_id=member_id,
+            multiplier=multiplier,
         )
-        if await self._check_score_cooldown(
+        if score is None:
+            return False
+
+        score_buffer.add(
             guild_id=guild_id,
             channel_id=channel_id,
             member_id=member_id,
-            score_src=models.ScoreSource.CHAT_REACTION,
+            score_src=score_src,
+            score_type=score_src.score_type,
             score=score,
-            sess=sess,
-        ):
-            await self._add_member_score(
-                guild_id=guild_id,
-                member_id=member_id,
-                score=score,
-                score_type=models.ScoreType.CHAT,
-                sess=sess,
-            )
-            _logger.info(f"add {score} chat reaction score to member {member_id}")
-        else:
-            _logger.info(f"member {member_id} chat reaction score is in cooldown")
-
-    @db.use_session
-    async def question_score(
-        self,
-        guild_id: int,
-        channel_id: int,
-        member_id: int,
-        *,
-        sess: AsyncSession | None = None,
-    ):
-        assert sess is not None
-
-        score = await self._get_action_score(
+        )
+        self._rank_award(
+            score_src=score_src,
             guild_id=guild_id,
-            channel_id=channel_id,
-            score_src=models.ScoreSource.QUESTION,
-            sess=sess,
+            member_id=member_id,
+            score=score,
         )
-        if await self._check_score_cooldown(
+        self._publish_award(
+            score_src=score_src,
             guild_id=guild_id,
             channel_id=channel_id,
             member_id=member_id,
-            score_src=models.ScoreSource.QUESTION,
             score=score,
-            sess=sess,
-        ):
-            await self._add_member_score(
-                guild_id=guild_id,
-                member_id=member_id,
-                score=score,
-                score_type=models.ScoreType.QUESTION,
-                sess=sess,
-            )
-            _logger.info(f"add {score} question score to member {member_id}")
-        else:
-            _logger.info(f"member {member_id} question score is in cooldown")
+        )
+        src_name = score_src.value.replace("_", " ")
+        _logger.info(f"add {score} {src_name} score to member {member_id}")
+        return True
 
-    @db.use_session
-    async def answer_score(
+    async def award_question(
         self,
         guild_id: int,
         channel_id: int,
-        member_id: int,
-        like: int,
-        dislike: int,
+        question: models.Question,
         *,
-        sess: AsyncSession | None = None,
-    ):
-        assert sess is not None
-
-        answer_score = await self._get_action_score(
-            guild_id=guild_id,
-            channel_id=channel_id,
-            score_src=models.ScoreSource.ANSWER,
-            sess=sess,
-        )
-        if await self._check_score_cooldown(
-            guild_id=guild_id,
-            channel_id=channel_id,
-            member_id=member_id,
-            score_src=models.ScoreSource.ANSWER,
-            score=answer_score,
-            sess=sess,
-        ):
-            await self._add_member_score(
-                guild_id=guild_id,
-                member_id=member_id,
-                score=answer_score,
-                score_type=models.ScoreType.QUESTION,
-                sess=sess,
+        sess: AsyncSession,
+    ) -> List[Award]:
+        """
+        Award the question score to its author, and the answer and answer
+        reaction scores to the authors of all its answers.
+
+        The awards are added to the session as one multi-row insert of score logs
+        and one upsert of user scores. Cooldowns are only checked here, the
+        returned awards must be passed to `apply_awards` once the session is
+        committed.
+        """
+        actions = [(models.ScoreSource.QUESTION, question.member_id, 1)]
+        for answer in question.answers:
+            actions.append((models.ScoreSource.ANSWER, answer.member_id, 1))
+            actions.append(
+                (
+                    models.ScoreSource.ANSWER_REACTION,
+                    answer.member_id,
+                    answer.like - answer.dislike,
+                )
             )
-            _logger.info(f"add {answer_score} answer score to member {member_id}")
-        else:
-            _logger.info(f"member {member_id} answer score is in cooldown")
 
-        answer_reation_score_base = await self._get_action_score(
-            guild_id=guild_id,
-            channel_id=channel_id,
-            score_src=models.ScoreSource.ANSWER_REACTION,
-            sess=sess,
+        awards: List[Award] = []
+        # actions which start a cooldown in this batch
+        awarded: Set[ScoreLogKey] = set()
+        logs: List[Dict[str, Any]] = []
+        increments: Dict[UserScoreKey, float] = {}
+        for score_src, member_id, multiplier in actions:
+            conf = self._configs.resolve(
+                score_src=score_src, guild_id=guild_id, channel_id=channel_id
+            )
+            key = (guild_id, channel_id, member_id, score_src)
+            if key in awarded or self._cooldowns.in_cooldown(key, conf.cooldown):
+                src_name = score_src.value.replace("_", " ")
+                _logger.info(f"member {member_id} {src_name} score is in cooldown")
+                continue
+            if conf.cooldown > 0:
+                awarded.add(key)
+
+            score = conf.score * multiplier
+            awards.append(
+                Award(
+                    score_src=score_src,
+                    guild_id=guild_id,
+                    channel_id=channel_id,
+                    member_id=member_id,
+                    score=score,
+                    cooldown=conf.cooldown,
+                )
+            )
+            logs.append(
+                new_score_log(
+                    guild_id=guild_id,
+                    channel_id=channel_id,
+                    member_id=member_id,
+                    score_src=score_src,
+                    score=score,
+                )
+            )
+            increment_key = (guild_id, member_id, score_src.score_type)
+            increments[increment_key] = increments.get(increment_key, 0) + score
+
+        await insert_score_logs(sess, logs)
+        await increment_user_scores(sess, increments)
+        _logger.info(
+            f"add {len(logs)} question scores to {len(increments)} members "
+            f"in channel {channel_id}"
         )
-        answer_reaction_score = answer_reation_score_base * (like - dislike)
-        if await self._check_score_cooldown(
-            guild_id=guild_id,
-            channel_id=channel_id,
-            member_id=member_id,
-            score_src=models.ScoreSource.ANSWER_REACTION,
-            score=answer_reaction_score,
-            sess=sess,
-        ):
-            await self._add_member_score(
-                guild_id=guild_id,
-                member_id=member_id,
-                score=answer_reaction_score,
-                score_type=models.ScoreType.QUESTION,
-                sess=sess,
+        return awards
+
+    def apply_awards(self, awards: Sequence[Award]):
+        """
+        Start the cooldowns of awards written by a committed session,
+        add them to the leaderboard and publish them.
+        """
+        for award in awards:
+            self._cooldowns.record(
+                (award.guild_id, award.channel_id, award.member_id, award.score_src),
+                award.cooldown,
             )
-            _logger.info(
-                f"add {answer_score} answer reaction score to member {member_id}"
+            self._rank_award(
+                score_src=award.score_src,
+                guild_id=award.guild_id,
+                member_id=award.member_id,
+                score=award.score,
+            )
+            self._publish_award(
+                score_src=award.score_src,
+                guild_id=award.guild_id,
+                channel_id=award.channel_id,
+                member_id=award.member_id,
+                score=award.score,
             )
-        else:
-            _logger.info(f"member {member_id} answer reaction score is in cooldown")
 
     @commands.command(
         name="get-score",
@@ -460,17 +313,12 @@ class ScoreCog(commands.Cog, name="score"):
         score_type: Annotated[models.ScoreType, utils.to_score_type],
     ):
         async with db.session_scope() as sess:
-            q = (
-                sa.select(models.UserScore)
-                .where(models.UserScore.guild_id == member.guild.id)
-                .where(models.UserScore.member_id == member.id)
-                .where(models.UserScore.score_type == score_type)
+            score = await get_member_score(
+                sess,
+                member_id=member.id,
+                guild_id=member.guild.id,
+                score_type=score_type,
             )
-            user_score = (await sess.execute(q)).scalar_one_or_none()
-            if user_score is None:
-                score = 0
-            else:
-                score = user_score.score
             symbol = await self._get_symbol(guild_id=member.guild.id, sess=sess)
 
         embed = discord.Embed(
@@ -482,6 +330,87 @@ class ScoreCog(commands.Cog, name="score"):
         embed.add_field(name="Score", value=f"{symbol}{score}", inline=True)
         await ctx.send(embed=embed)
 
+    @commands.command(
+        name="score-period",
+        help="Get a member's score since the start of the current period. "
+        "Periods can be DAY, WEEK or MONTH. "
+        "Score types can be POST, QUESTION or CHAT, the total score is got "
+        "when score type is not set.",
+    )
+    @commands.has_role(config.discord_role)
+    async def get_member_period_score(
+        self,
+        ctx: commands.Context,
+        member: discord.Member,
+        period: Annotated[models.ScorePeriod, utils.to_score_period],
+        score_type: Optional[
+            Annotated[models.ScoreType, utils.to_score_type]
+        ] = None,
+    ):
+        since = period.start()
+        async with db.session_scope() as sess:
+            score = await get_member_score(
+                sess,
+                member_id=member.id,
+                guild_id=member.guild.id,
+                score_type=score_type,
+                period=period,
+            )
+            symbol = await self._get_symbol(guild_id=member.guild.id, sess=sess)
+
+        embed = discord.Embed(
+            color=discord.Color.from_str(config.info_color),
+            title="Get period score result",
+        )
+        embed.add_field(name="Member", value=member.mention, inline=True)
+        embed.add_field(
+            name="Type",
+            value=score_type.name if score_type is not None else "TOTAL",
+            inline=True,
+        )
+        embed.add_field(name="Since", value=since.isoformat(), inline=True)
+        embed.add_field(name="Score", value=f"{symbol}{score}", inline=True)
+        await ctx.send(embed=embed)
+
+    @commands.command(
+        name="channel-score-period",
+        help="Get the channels of this guild with the most score since the start "
+        "of the current period. Periods can be DAY, WEEK or MONTH.",
+    )
+    @commands.has_role(config.discord_role)
+    async def get_channel_period_scores(
+        self,
+        ctx: commands.Context,
+        period: Annotated[models.ScorePeriod, utils.to_score_period],
+        count: commands.Range[int, 1, MAX_TOP_COUNT] = 10,
+    ):
+        assert ctx.guild is not None
+        since = period.start()
+        async with db.session_scope() as sess:
+            total = sa.func.sum(models.ScoreRollup.score).label("total")
+            q = (
+                sa.select(models.ScoreRollup.channel_id, total)
+                .where(models.ScoreRollup.guild_id == ctx.guild.id)
+                .where(models.ScoreRollup.day >= since)
+                .group_by(models.ScoreRollup.channel_id)
+                .order_by(sa.desc(total))
+                .limit(count)
+            )
+            rows = (await sess.execute(q)).all()
+            symbol = await self._get_symbol(guild_id=ctx.guild.id, sess=sess)
+
+        lines = [
+            f"{i}. <#{channel_id}> {symbol}{score}"
+            for i, (channel_id, score) in enumerate(rows, start=1)
+        ]
+        embed = discord.Embed(
+            color=discord.Color.from_str(config.info_color),
+            title="Get channel period scores result",
+            description="\n".join(lines) if len(lines) > 0 else "No scores yet.",
+        )
+        embed.add_field(name="Since", value=since.isoformat(), inline=True)
+        await ctx.send(embed=embed)
+
     @commands.command(
         name="add-score",
         help="Manually add some score of the specified type to a member. "
@@ -504,6 +433,12 @@ class ScoreCog(commands.Cog, name="score"):
                 sess=sess
             )
             symbol = await self._get_symbol(guild_id=member.guild.id, sess=sess)
+        leaderboard.add(
+            guild_id=member.guild.id,
+            member_id=member.id,
+            score_type=score_type,
+            score=score,
+        )
 
         embed = discord.Embed(
             color=discord.Color.from_str(config.success_color),
@@ -514,6 +449,82 @@ class ScoreCog(commands.Cog, name="score"):
         embed.add_field(name="Score", value=f"{symbol}{score}", inline=True)
         await ctx.send(embed=embed)
 
+    @commands.command(
+        name="top",
+        help="Get the top members of this guild by score. "
+        "Score types can be POST, QUESTION or CHAT, the total score is ranked "
+        "when score type is not set.",
+    )
+    async def get_top_members(
+        self,
+        ctx: commands.Context,
+        score_type: Optional[
+            Annotated[models.ScoreType, utils.to_score_type]
+        ] = None,
+        count: commands.Range[int, 1, MAX_TOP_COUNT] = 10,
+    ):
+        assert ctx.guild is not None
+        board = leaderboard.get(guild_id=ctx.guild.id, score_type=score_type)
+        symbol = await self._get_symbol(guild_id=ctx.guild.id)
+
+        lines = [
+            f"{i}. <@{member_id}> {symbol}{score}"
+            for i, (member_id, score) in enumerate(board.top(count), start=1)
+        ]
+        embed = discord.Embed(
+            color=discord.Color.from_str(config.info_color),
+            title="Top members",
+            description="\n".join(lines) if len(lines) > 0 else "No scores yet.",
+        )
+        embed.add_field(
+            name="Type",
+            value=score_type.name if score_type is not None else "TOTAL",
+            inline=True,
+        )
+        embed.add_field(name="Members", value=len(board), inline=True)
+        await ctx.send(embed=embed)
+
+    @commands.command(
+        name="rank",
+        help="Get the rank of a member in this guild, yourself by default. "
+        "Score types can be POST, QUESTION or CHAT, the total score is ranked "
+        "when score type is not set.",
+    )
+    async def get_member_rank(
+        self,
+        ctx: commands.Context,
+        member: Optional[discord.Member] = None,
+        score_type: Optional[
+            Annotated[models.ScoreType, utils.to_score_type]
+        ] = None,
+    ):
+        assert ctx.guild is not None
+        if member is None:
+            assert isinstance(ctx.author, discord.Member)
+            member = ctx.author
+        board = leaderboard.get(guild_id=ctx.guild.id, score_type=score_type)
+        symbol = await self._get_symbol(guild_id=ctx.guild.id)
+
+        rank = board.rank(member.id)
+        embed = discord.Embed(
+            color=discord.Color.from_str(config.info_color),
+            title="Get rank result",
+        )
+        embed.add_field(name="Member", value=member.mention, inline=True)
+        embed.add_field(
+            name="Type",
+            value=score_type.name if score_type is not None else "TOTAL",
+            inline=True,
+        )
+        if rank is None:
+            embed.add_field(name="Rank", value="Unranked", inline=True)
+        else:
+            embed.add_field(name="Rank", value=f"{rank}/{len(board)}", inline=True)
+            embed.add_field(
+                name="Score", value=f"{symbol}{board.get(member.id)}", inline=True
+            )
+        await ctx.send(embed=embed)
+
     async def cog_command_error(self, ctx: commands.Context, error: Exception):
         _logger.error(error)
         embed = discord.Embed(
@@ -553,6 +564,8 @@ class ScoreCog(commands.Cog, name="score"):
             )
             if channel is not None:
                 q = q.where(models.ScoreConfig.channel_id == channel.id)
+            else:
+                q = q.where(models.ScoreConfig.channel_id.is_(None))
             conf = (await sess.execute(q)).scalar_one_or_none()
             if conf is not None:
                 conf.score = score
@@ -569,12 +582,12 @@ class ScoreCog(commands.Cog, name="score"):
             symbol = await self._get_symbol(guild_id=guild_id, sess=sess)
             
         # update local score config
-        if channel is not None:
-            score_key = (guild_id, channel.id)
-        else:
-            score_key = guild_id
-
-        self._action_scores[score_src][score_key] = score
+        self._configs.set_score(
+            score_src=score_src,
+            guild_id=guild_id,
+            channel_id=channel.id if channel is not None else None,
+            score=score,
+        )
 
         embed = discord.Embed(
             color=discord.Color.from_str(config.success_color),
@@ -604,12 +617,11 @@ class ScoreCog(commands.Cog, name="score"):
         assert ctx.guild is not None
         guild_id = ctx.guild.id
 
-        async with db.session_scope() as sess:
-            channel_id = channel.id if channel is not None else None
-            score = await self._get_action_score(
-                score_src=score_src, guild_id=guild_id, channel_id=channel_id, sess=sess
-            )
-            symbol = await self._get_symbol(guild_id=guild_id, sess=sess)
+        channel_id = channel.id if channel is not None else None
+        score = self._configs.resolve(
+            score_src=score_src, guild_id=guild_id, channel_id=channel_id
+        ).score
+        symbol = await self._get_symbol(guild_id=guild_id)
 
         embed = discord.Embed(
             color=discord.Color.from_str(config.info_color),
@@ -651,6 +663,8 @@ class ScoreCog(commands.Cog, name="score"):
             )
             if channel is not None:
                 q = q.where(models.ScoreConfig.channel_id == channel.id)
+            else:
+                q = q.where(models.ScoreConfig.channel_id.is_(None))
             conf = (await sess.execute(q)).scalar_one_or_none()
             if conf is not None:
                 conf.cooldown = cooldown_seconds
@@ -666,11 +680,12 @@ class ScoreCog(commands.Cog, name="score"):
             await sess.commit()
 
         # update local cooldown config
-        if channel is not None:
-            key = (guild_id, channel.id)
-        else:
-            key = guild_id
-        self._action_cooldowns[score_src][key] = cooldown_seconds
+        self._configs.set_cooldown(
+            score_src=score_src,
+            guild_id=guild_id,
+            channel_id=channel.id if channel is not None else None,
+            cooldown=cooldown_seconds,
+        )
 
         embed = discord.Embed(
             color=discord.Color.from_str(config.success_color),
@@ -700,11 +715,10 @@ class ScoreCog(commands.Cog, name="score"):
         assert ctx.guild is not None
         guild_id = ctx.guild.id
 
-        async with db.session_scope() as sess:
-            channel_id = channel.id if channel is not None else None
-            cooldown = await self._get_action_cooldown(
-                score_src=score_src, guild_id=guild_id, channel_id=channel_id, sess=sess
-            )
+        channel_id = channel.id if channel is not None else None
+        cooldown = self._configs.resolve(
+            score_src=score_src, guild_id=guild_id, channel_id=channel_id
+        ).cooldown
 
         embed = discord.Embed(
             color=discord.Color.from_str(config.info_color),
@@ -14,6 +14,16 @@ log_dir: str = _log.get("dir", "")
 
 db: str = _c.get("db", "")
 
+_db_pool: Dict[str, Any] = _c.get("db_pool") or {}
+db_pool_size: int = _db_pool.get("size", 5)
+db_pool_max_overflow: int = _db_pool.get("max_overflow", 10)
+# seconds after which connections are replaced, -1 to keep them
+db_pool_recycle: int = _db_pool.get("recycle", 3600)
+# seconds to wait for a connection before giving up
+db_pool_timeout: float = _db_pool.get("timeout", 30)
+# ping connections which have been idle for more seconds on checkout, -1 to never
+db_pool_pre_ping_idle: float = _db_pool.get("pre_ping_idle", 60)
+
 _discord: Dict[str, Any] = _c.get("discord")
 
 discord_token: str = _discord.get("token", "")
@@ -23,6 +33,27 @@ _app = _c.get("app")
 app_host: str = _app.get("host", "0.0.0.0")
 app_port: int = _app.get("port", 8080)
 allow_origins: List[str] = _app.get("allow_origins", ["*"])
+# seconds to cache names of guilds and channels, and ids which are not found
+app_name_ttl: float = _app.get("name_ttl", 3600)
+app_not_found_ttl: float = _app.get("not_found_ttl", 300)
+app_user_ttl: float = _app.get("user_ttl", 3600)
+app_user_cache_size: int = _app.get("user_cache_size", 10000)
+# trust members who have scores in the database without asking discord
+app_trust_db_users: bool = _app.get("trust_db_users", False)
+
+_score: Dict[str, Any] = _c.get("score") or {}
+score_flush_interval: float = _score.get("flush_interval", 5)
+score_flush_size: int = _score.get("flush_size", 500)
+# failed flushes of a batch of awards before the batch is dropped
+score_flush_attempts: int = _score.get("flush_attempts", 5)
+score_cooldown_index_size: int = _score.get("cooldown_index_size", 100000)
+score_event_queue_size: int = _score.get("event_queue_size", 100)
+# score logs older than the retention days are archived and deleted
+score_retention_days: int = _score.get("retention_days", 90)
+score_archive_dir: str = _score.get("archive_dir", "archive")
+score_compact_batch_size: int = _score.get("compact_batch_size", 1000)
+# seconds between compactions run by the bot, 0 to only compact by command
+score_compact_interval: float = _score.get("compact_interval", 0)
 
 info_color = "#03a8f4"
 success_color = "#66bb6a"
@@ -1,17 +1,33 @@
 from __future__ import annotations
 
+import bisect
 import threading
+import time
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Callable, Coroutine, TypeVar
+from typing import (Any, AsyncGenerator, Callable, Coroutine, Dict, List,
+                    Optional, TypeVar)
 
+import sqlalchemy as sa
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (AsyncEngine, AsyncSession,
                                     async_sessionmaker, create_async_engine)
 from sqlalchemy.orm import DeclarativeBase, MappedAsDataclass
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from typing_extensions import ParamSpec
 
 from fuo import config
 
-__all__ = ["session_scope", "init", "close", "Base", "get_session", "use_session"]
+__all__ = [
+    "session_scope",
+    "init",
+    "close",
+    "Base",
+    "get_session",
+    "use_session",
+    "PoolMetrics",
+    "pool_metrics",
+    "pool_stats",
+]
 
 _local = threading.local()
 
@@ -56,15 +72,123 @@ class Base(DeclarativeBase, MappedAsDataclass):
     pass
 
 
+class PoolMetrics(object):
+    """
+    Counters of connection checkouts, with a histogram of the time waited for
+    a connection to be returned to the pool.
+    """
+
+    # upper bounds of wait time buckets in seconds, the last bucket is unbounded
+    WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5)
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.pings = 0
+        self.wait_sum = 0.0
+        self.wait_counts: List[int] = [0] * (len(self.WAIT_BUCKETS) + 1)
+
+    def observe_wait(self, seconds: float):
+        self.wait_sum += seconds
+        self.wait_counts[bisect.bisect_left(self.WAIT_BUCKETS, seconds)] += 1
+
+
+pool_metrics = PoolMetrics()
+
+
+class _MeteredPool(AsyncAdaptedQueuePool):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        get = self._pool.get
+
+        def metered_get(block: bool = True, timeout: Optional[float] = None):
+            # only the wait for an idle connection in the pool is observed,
+            # connecting new connections and pinging idle ones are not
+            start = time.monotonic()
+            try:
+                return get(block, timeout)
+            finally:
+                pool_metrics.observe_wait(time.monotonic() - start)
+
+        self._pool.get = metered_get  # type: ignore[method-assign]
+
+    def connect(self):
+        try:
+            conn = super().connect()
+        except sa.exc.TimeoutError:
+            pool_metrics.timeouts += 1
+            raise
+        pool_metrics.checkouts += 1
+        return conn
+
+
+def _ping_idle_connections(engine: AsyncEngine, idle: float):
+    """Ping connections on checkout only if they have been idle for a while."""
+
+    @sa.event.listens_for(engine.sync_engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        connection_record.info["checkin_at"] = time.monotonic()
+
+    @sa.event.listens_for(engine.sync_engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        checkin_at = connection_record.info.get("checkin_at")
+        if checkin_at is None or time.monotonic() - checkin_at < idle:
+            return
+
+        pool_metrics.pings += 1
+        try:
+            engine.dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            # the pool retries the checkout with a new connection
+            raise sa.exc.DisconnectionError() from e
+
+
+def pool_stats() -> Dict[str, Any]:
+    if not hasattr(_local, "engine"):
+        raise ValueError("db has not been initialized")
+
+    engine: AsyncEngine = _local.engine
+    pool = engine.sync_engine.pool
+    stats: Dict[str, Any] = {}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats["size"] = pool.size()
+        stats["checked_in"] = pool.checkedin()
+        stats["checked_out"] = pool.checkedout()
+        stats["overflow"] = pool.overflow()
+    stats["checkouts"] = pool_metrics.checkouts
+    stats["timeouts"] = pool_metrics.timeouts
+    stats["pings"] = pool_metrics.pings
+    stats["wait_sum"] = pool_metrics.wait_sum
+    stats["wait_buckets"] = {
+        f"le_{bound}": count
+        for bound, count in zip(
+            list(PoolMetrics.WAIT_BUCKETS) + ["inf"], pool_metrics.wait_counts
+        )
+    }
+    return stats
+
+
 async def init(db: str = config.db):
     if hasattr(_local, "session") or hasattr(_local, "engine"):
         raise ValueError("db has been initialized")
 
+    kwargs: Dict[str, Any] = {}
+    # sqlite connections are not pooled
+    if make_url(db).get_backend_name() != "sqlite":
+        kwargs.update(
+            poolclass=_MeteredPool,
+            pool_size=config.db_pool_size,
+            max_overflow=config.db_pool_max_overflow,
+            pool_recycle=config.db_pool_recycle,
+            pool_timeout=config.db_pool_timeout,
+        )
     engine = create_async_engine(
         db,
-        pool_pre_ping=True,
+        **kwargs,
         # echo=True,
     )
+    if config.db_pool_pre_ping_idle >= 0:
+        _ping_idle_connections(engine, config.db_pool_pre_ping_idle)
     session = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 
     _local.engine = engine
@@ -2,23 +2,26 @@ import argparse
 from typing import Optional, Sequence
 
 from fuo.migrations import run_migrations
-from fuo.run import run
+from fuo.run import compact, run
 
 
 def main(input_args: Optional[Sequence[str]] = None):
     parser = argparse.ArgumentParser(description="FUO discord bot", prog="fuo-bot")
     parser.add_argument(
         "action",
-        choices=["run", "migrate"],
+        choices=["run", "migrate", "compact"],
         help="FUO bot actions:\n"
         "run: start the bot\n"
-        "migrate: upgrade database to the latest",
+        "migrate: upgrade database to the latest\n"
+        "compact: archive and delete score logs older than the retention days",
     )
     args = parser.parse_args(input_args)
     if args.action == "run":
         run()
     elif args.action == "migrate":
         run_migrations()
+    elif args.action == "compact":
+        compact()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,24 @@
+"""add score logs member cursor index
+
+Revision ID: 0b5c7a1e9f3d
+Revises: 931795992e15
+Create Date: 2026-10-17 13:05:12.418207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0b5c7a1e9f3d'
+down_revision = '931795992e15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_score_logs_member_id_id', 'score_logs', ['member_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_score_logs_member_id_id', table_name='score_logs')
@@ -0,0 +1,24 @@
+"""add opened question index
+
+Revision ID: 3a9d6f1c2e84
+Revises: c81f4b2d7a90
+Create Date: 2026-10-17 16:20:41.518302
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3a9d6f1c2e84'
+down_revision = 'c81f4b2d7a90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_questions_opened_id', 'questions', ['opened', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_questions_opened_id', table_name='questions')
@@ -0,0 +1,51 @@
+"""add score_rollups table
+
+Revision ID: 5e2f8d4a61c7
+Revises: 0b5c7a1e9f3d
+Create Date: 2026-10-17 14:32:08.615094
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e2f8d4a61c7'
+down_revision = '0b5c7a1e9f3d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('score_rollups',
+    sa.Column('guild_id', sa.BigInteger(), nullable=False),
+    sa.Column('channel_id', sa.BigInteger(), nullable=False),
+    sa.Column('member_id', sa.BigInteger(), nullable=False),
+    sa.Column('score_src', sa.Enum('POST', 'POST_REACTION', 'QUESTION', 'ANSWER', 'ANSWER_REACTION', 'CHAT', 'CHAT_REACTION', name='scoresource'), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('score', sa.Float(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_score_rollups_bucket', 'score_rollups', ['guild_id', 'channel_id', 'member_id', 'score_src', 'day'], unique=True)
+    op.create_index('ix_score_rollups_guild_day', 'score_rollups', ['guild_id', 'day'], unique=False)
+    op.create_index('ix_score_rollups_member_day', 'score_rollups', ['member_id', 'day'], unique=False)
+
+    # roll up the existing score logs
+    op.execute(
+        "INSERT INTO score_rollups "
+        "(guild_id, channel_id, member_id, score_src, day, score, count, created_at, updated_at) "
+        "SELECT guild_id, channel_id, member_id, score_src, DATE(created_at), SUM(score), COUNT(id), "
+        "CURRENT_TIMESTAMP, CURRENT_TIMESTAMP FROM score_logs "
+        "GROUP BY guild_id, channel_id, member_id, score_src, DATE(created_at)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_score_rollups_member_day', table_name='score_rollups')
+    op.drop_index('ix_score_rollups_guild_day', table_name='score_rollups')
+    op.drop_index('ix_score_rollups_bucket', table_name='score_rollups')
+    op.drop_table('score_rollups')
@@ -0,0 +1,24 @@
+"""add answer message index
+
+Revision ID: 931795992e15
+Revises: d7e22c0a87b4
+Create Date: 2026-10-17 12:20:41.063518
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '931795992e15'
+down_revision = 'd7e22c0a87b4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_answers_channel_message', 'answers', ['channel_id', 'message_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_answers_channel_message', table_name='answers')
@@ -0,0 +1,48 @@
+"""replace single column indexes
+
+Revision ID: c81f4b2d7a90
+Revises: 5e2f8d4a61c7
+Create Date: 2026-10-17 15:48:26.370511
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c81f4b2d7a90'
+down_revision = '5e2f8d4a61c7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # score logs expire and cooldowns are warmed by creation time
+    op.create_index('ix_score_logs_created_at', 'score_logs', ['created_at'], unique=False)
+
+    # leading columns of composite indexes
+    op.drop_index('ix_score_logs_member_id', table_name='score_logs')
+    op.drop_index('ix_user_scores_guild_id', table_name='user_scores')
+    op.drop_index('ix_questions_guild_id', table_name='questions')
+    op.drop_index('ix_answers_channel_id', table_name='answers')
+    # compete with composite indexes which also cover them
+    op.drop_index('ix_questions_channel_id', table_name='questions')
+    op.drop_index('ix_answers_guild_id', table_name='answers')
+    # never queried alone, or too few distinct values to be selective
+    op.drop_index('ix_score_logs_channel_id', table_name='score_logs')
+    op.drop_index('ix_score_logs_score_src', table_name='score_logs')
+    op.drop_index('ix_user_scores_score_type', table_name='user_scores')
+
+
+def downgrade() -> None:
+    op.create_index('ix_user_scores_score_type', 'user_scores', ['score_type'], unique=False)
+    op.create_index('ix_score_logs_score_src', 'score_logs', ['score_src'], unique=False)
+    op.create_index('ix_score_logs_channel_id', 'score_logs', ['channel_id'], unique=False)
+    op.create_index('ix_answers_guild_id', 'answers', ['guild_id'], unique=False)
+    op.create_index('ix_questions_channel_id', 'questions', ['channel_id'], unique=False)
+    op.create_index('ix_answers_channel_id', 'answers', ['channel_id'], unique=False)
+    op.create_index('ix_questions_guild_id', 'questions', ['guild_id'], unique=False)
+    op.create_index('ix_user_scores_guild_id', 'user_scores', ['guild_id'], unique=False)
+    op.create_index('ix_score_logs_member_id', 'score_logs', ['member_id'], unique=False)
+
+    op.drop_index('ix_score_logs_created_at', table_name='score_logs')
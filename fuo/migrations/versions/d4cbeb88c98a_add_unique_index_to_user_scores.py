@@ -0,0 +1,43 @@
+"""add unique index to user_scores
+
+Revision ID: d4cbeb88c98a
+Revises: be7e9de3ccb7
+Create Date: 2026-10-17 10:12:31.482207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4cbeb88c98a'
+down_revision = 'be7e9de3ccb7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # merge duplicated rows into the oldest one before adding the unique index
+    conn = op.get_bind()
+    duplicates = conn.execute(sa.text(
+        "SELECT guild_id, member_id, score_type, MIN(id), SUM(score) FROM user_scores "
+        "GROUP BY guild_id, member_id, score_type HAVING COUNT(id) > 1"
+    )).all()
+    for guild_id, member_id, score_type, id, score in duplicates:
+        conn.execute(
+            sa.text("UPDATE user_scores SET score = :score WHERE id = :id"),
+            {"score": score, "id": id},
+        )
+        conn.execute(
+            sa.text(
+                "DELETE FROM user_scores WHERE guild_id = :guild_id AND member_id = :member_id "
+                "AND score_type = :score_type AND id <> :id"
+            ),
+            {"guild_id": guild_id, "member_id": member_id, "score_type": score_type, "id": id},
+        )
+
+    op.create_index('ix_user_scores_guild_member_type', 'user_scores', ['guild_id', 'member_id', 'score_type'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_scores_guild_member_type', table_name='user_scores')
@@ -0,0 +1,24 @@
+"""add open question index
+
+Revision ID: d7e22c0a87b4
+Revises: 666ee5caa4d2
+Create Date: 2026-10-17 11:47:08.730164
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7e22c0a87b4'
+down_revision = '666ee5caa4d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_questions_guild_channel_opened_id', 'questions', ['guild_id', 'channel_id', 'opened', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_questions_guild_channel_opened_id', table_name='questions')
@@ -1,7 +1,8 @@
 from .channel import ChannelConfig, ChannelType
+from .emoji import EmojiClass, ReactionEmoji
 from .question import Answer, Question
-from .score import (ScoreConfig, ScoreLog, ScoreSource, ScoreSymbol, ScoreType,
-                    UserScore)
+from .score import (ScoreConfig, ScoreLog, ScorePeriod, ScoreRollup, ScoreSource,
+                    ScoreSymbol, ScoreType, UserScore)
 
 __all__ = [
     "UserScore",
@@ -9,9 +10,13 @@ __all__ = [
     "ScoreConfig",
     "ScoreSource",
     "ScoreLog",
+    "ScoreRollup",
+    "ScorePeriod",
     "ScoreSymbol",
     "ChannelType",
     "ChannelConfig",
     "Question",
     "Answer",
+    "EmojiClass",
+    "ReactionEmoji",
 ]
@@ -0,0 +1,29 @@
+from enum import Enum
+from typing import Optional
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from fuo.db import Base
+
+from .base import BaseMixin
+
+
+class EmojiClass(str, Enum):
+    LIKE = "like"
+    DISLIKE = "dislike"
+
+
+class ReactionEmoji(Base, BaseMixin):
+    __tablename__ = "reaction_emojis"
+
+    guild_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, index=True)
+    # unicode emoji, or name of the custom guild emoji
+    emoji: Mapped[str] = mapped_column(sa.String(64), nullable=False, index=False)
+    emoji_class: Mapped[EmojiClass] = mapped_column(
+        sa.Enum(EmojiClass), nullable=False, index=False
+    )
+    # id of the custom guild emoji, None for unicode emoji
+    emoji_id: Mapped[Optional[int]] = mapped_column(
+        sa.BigInteger, nullable=True, index=False, default=None
+    )
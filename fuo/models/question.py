@@ -10,10 +10,21 @@ from .base import BaseMixin
 
 class Question(Base, BaseMixin):
     __tablename__ = "questions"
+    __table_args__ = (
+        sa.Index(
+            "ix_questions_guild_channel_opened_id",
+            "guild_id",
+            "channel_id",
+            "opened",
+            "id",
+        ),
+        # open questions of all channels are loaded by the question cog
+        sa.Index("ix_questions_opened_id", "opened", "id"),
+    )
 
-    guild_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, index=True)
+    guild_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, index=False)
     member_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, index=True)
-    channel_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, index=True)
+    channel_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, index=False)
     opened: Mapped[bool] = mapped_column(nullable=False, index=False, default=True)
 
     answers: Mapped[List["Answer"]] = relationship(
@@ -27,10 +38,13 @@ class Question(Base, BaseMixin):
 
 class Answer(Base, BaseMixin):
     __tablename__ = "answers"
+    __table_args__ = (
+        sa.Index("ix_answers_channel_message", "channel_id", "message_id"),
+    )
 
-    guild_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, index=True)
+    guild_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, index=False)
     member_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, index=True)
-    channel_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, index=True)
+    channel_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, index=False)
     message_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, index=False)
     question_id: Mapped[int] = mapped_column(nullable=False, index=True)
 
@@ -1,5 +1,6 @@
+from datetime import date, timedelta
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 
 import sqlalchemy as sa
 from sqlalchemy.orm import Mapped, mapped_column
@@ -14,14 +15,27 @@ class ScoreType(str, Enum):
     QUESTION = "question"
     CHAT = "chat"
 
+    @property
+    def sources(self) -> List["ScoreSource"]:
+        return [src for src in ScoreSource if src.score_type == self]
+
 
 class UserScore(Base, BaseMixin):
     __tablename__ = "user_scores"
+    __table_args__ = (
+        sa.Index(
+            "ix_user_scores_guild_member_type",
+            "guild_id",
+            "member_id",
+            "score_type",
+            unique=True,
+        ),
+    )
 
-    guild_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, index=True)
+    guild_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, index=False)
     member_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, index=True)
     score_type: Mapped[ScoreType] = mapped_column(
-        sa.Enum(ScoreType), index=True, nullable=False
+        sa.Enum(ScoreType), index=False, nullable=False
     )
     score: Mapped[float] = mapped_column(nullable=False, index=False, default=0)
 
@@ -35,6 +49,18 @@ class ScoreSource(str, Enum):
     CHAT = "chat"
     CHAT_REACTION = "chat_reaction"
 
+    @property
+    def score_type(self) -> ScoreType:
+        if self in (ScoreSource.POST, ScoreSource.POST_REACTION):
+            return ScoreType.POST
+        if self in (
+            ScoreSource.QUESTION,
+            ScoreSource.ANSWER,
+            ScoreSource.ANSWER_REACTION,
+        ):
+            return ScoreType.QUESTION
+        return ScoreType.CHAT
+
 
 class ScoreConfig(Base, BaseMixin):
     __tablename__ = "score_configs"
@@ -55,17 +81,69 @@ class ScoreConfig(Base, BaseMixin):
 
 class ScoreLog(Base, BaseMixin):
     __tablename__ = "score_logs"
+    __table_args__ = (
+        sa.Index("ix_score_logs_member_id_id", "member_id", "id"),
+        sa.Index("ix_score_logs_created_at", "created_at"),
+    )
 
     guild_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, index=True)
-    channel_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, index=True)
-    member_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, index=True)
+    channel_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, index=False)
+    member_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, index=False)
 
     score_src: Mapped[ScoreSource] = mapped_column(
-        sa.Enum(ScoreSource), nullable=False, index=True
+        sa.Enum(ScoreSource), nullable=False, index=False
     )
     score: Mapped[float] = mapped_column(nullable=False, index=False)
 
 
+class ScoreRollup(Base, BaseMixin):
+    """Daily totals of score logs."""
+
+    __tablename__ = "score_rollups"
+    __table_args__ = (
+        sa.Index(
+            "ix_score_rollups_bucket",
+            "guild_id",
+            "channel_id",
+            "member_id",
+            "score_src",
+            "day",
+            unique=True,
+        ),
+        sa.Index("ix_score_rollups_guild_day", "guild_id", "day"),
+        sa.Index("ix_score_rollups_member_day", "member_id", "day"),
+    )
+
+    guild_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False)
+    channel_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False)
+    member_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False)
+    score_src: Mapped[ScoreSource] = mapped_column(
+        sa.Enum(ScoreSource), nullable=False
+    )
+    day: Mapped[date] = mapped_column(sa.Date, nullable=False)
+
+    score: Mapped[float] = mapped_column(nullable=False, index=False, default=0)
+    count: Mapped[int] = mapped_column(
+        sa.Integer, nullable=False, index=False, default=0
+    )
+
+
+class ScorePeriod(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+    def start(self, today: Optional[date] = None) -> date:
+        """First day of the current period."""
+        if today is None:
+            today = date.today()
+        if self == ScorePeriod.DAY:
+            return today
+        if self == ScorePeriod.WEEK:
+            return today - timedelta(days=today.weekday())
+        return today.replace(day=1)
+
+
 class ScoreSymbol(Base, BaseMixin):
     __tablename__ = "score_symbols"
 
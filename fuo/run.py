@@ -1,3 +1,4 @@
+import logging
 import signal
 
 import anyio
@@ -5,8 +6,16 @@ import anyio
 from fuo import config, db, log
 from fuo.app import App
 from fuo.bot import run_bot
+from fuo.score import (
+    answer_reaction_buffer,
+    compact_score_logs,
+    run_compaction,
+    score_buffer,
+)
 
-__all__ = ["run"]
+__all__ = ["run", "compact"]
+
+_logger = logging.getLogger(__name__)
 
 async def _run():
     log.init()
@@ -26,11 +35,35 @@ async def _run():
 
             tg.start_soon(run_bot)
             tg.start_soon(app.run, config.app_host, config.app_port)
+            tg.start_soon(score_buffer.run)
+            tg.start_soon(answer_reaction_buffer.run)
+            tg.start_soon(run_compaction)
     finally:
-        await db.close()
+        # flush pending scores and reactions before the database is closed
+        with anyio.CancelScope(shield=True):
+            # a failed flush of one buffer must not lose the other
+            for buffer in (score_buffer, answer_reaction_buffer):
+                try:
+                    await buffer.close()
+                except Exception as e:
+                    _logger.error(f"close {type(buffer).__name__} failed: {e}")
+            await db.close()
 
 def run():
     try:
         anyio.run(_run)
     except KeyboardInterrupt:
-        pass
\ No newline at end of file
+        pass
+
+
+async def _compact():
+    log.init()
+    await db.init()
+    try:
+        await compact_score_logs()
+    finally:
+        await db.close()
+
+
+def compact():
+    anyio.run(_compact)
\ No newline at end of file
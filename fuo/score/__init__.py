@@ -0,0 +1,58 @@
+from .buffer import ScoreBuffer, WriteBehindBuffer, score_buffer
+from .compaction import compact_score_logs, run_compaction
+from .cooldown import CooldownIndex, ScoreLogKey, cooldown_warm_query
+from .events import ScoreEvent, ScoreEventBus, ScoreSubscription, score_events
+from .leaderboard import Leaderboard, RankedScores, leaderboard
+from .logs import member_logs_query
+from .reaction import (
+    AnswerReactionBuffer,
+    answer_reaction_buffer,
+    answer_reaction_update,
+)
+from .resolver import ActionConfig, ScoreConfigResolver
+from .totals import (
+    get_member_score,
+    get_members_scores,
+    member_score_query,
+    members_scores_query,
+    period_score_query,
+)
+from .writer import (
+    UserScoreKey,
+    increment_user_scores,
+    insert_score_logs,
+    new_score_log,
+)
+
+__all__ = [
+    "WriteBehindBuffer",
+    "ScoreBuffer",
+    "score_buffer",
+    "AnswerReactionBuffer",
+    "answer_reaction_buffer",
+    "answer_reaction_update",
+    "compact_score_logs",
+    "run_compaction",
+    "CooldownIndex",
+    "ScoreLogKey",
+    "cooldown_warm_query",
+    "ScoreEvent",
+    "ScoreSubscription",
+    "ScoreEventBus",
+    "score_events",
+    "RankedScores",
+    "Leaderboard",
+    "leaderboard",
+    "member_logs_query",
+    "ActionConfig",
+    "ScoreConfigResolver",
+    "member_score_query",
+    "period_score_query",
+    "members_scores_query",
+    "get_member_score",
+    "get_members_scores",
+    "UserScoreKey",
+    "new_score_log",
+    "increment_user_scores",
+    "insert_score_logs",
+]
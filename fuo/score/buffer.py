@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from typing import Any, Collection, Dict, List, Optional, Tuple
+
+from fuo import config, db, models
+
+from .writer import (
+    UserScoreKey,
+    increment_user_scores,
+    insert_score_logs,
+    new_score_log,
+)
+
+__all__ = ["WriteBehindBuffer", "ScoreBuffer", "score_buffer"]
+
+_logger = logging.getLogger(__name__)
+
+
+class WriteBehindBuffer(object):
+    """
+    Base of in-memory buffers which are written to the database in batches.
+
+    `run` flushes every `flush_interval` seconds, or earlier once `flush_size`
+    items are pending. `close` must be awaited on shutdown to flush the rest.
+    """
+
+    def __init__(self, flush_interval: float, flush_size: int) -> None:
+        self._flush_interval = flush_interval
+        self._flush_size = flush_size
+
+        # asyncio primitives are created lazily inside the running loop
+        self._lock: Optional[asyncio.Lock] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def _pending_count(self) -> int:
+        raise NotImplementedError
+
+    async def _flush(self):
+        """Write all pending items, and keep them pending if the write fails."""
+        raise NotImplementedError
+
+    def _notify(self):
+        if self._pending_count() >= self._flush_size and self._wakeup is not None:
+            self._wakeup.set()
+
+    async def flush(self):
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self._pending_count() > 0:
+                await self._flush()
+
+    async def run(self):
+        self._wakeup = asyncio.Event()
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=self._flush_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                await self.flush()
+            except Exception as e:
+                _logger.error(f"flush {type(self).__name__} failed: {e}")
+
+    async def close(self):
+        await self.flush()
+
+
+class ScoreBuffer(WriteBehindBuffer):
+    """
+    Write-behind accumulator of score awards.
+
+    Awards are coalesced in memory and written by `flush` in one transaction:
+    score logs as a multi-row insert and user scores as one upsert.
+
+    A batch which fails to be written is retried before newer awards, and
+    dropped with an error log after `flush_attempts` failures.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = config.score_flush_interval,
+        flush_size: int = config.score_flush_size,
+        flush_attempts: int = config.score_flush_attempts,
+    ) -> None:
+        super().__init__(flush_interval=flush_interval, flush_size=flush_size)
+        self._flush_attempts = flush_attempts
+
+        self._logs: List[Dict[str, Any]] = []
+        self._increments: Dict[UserScoreKey, float] = {}
+
+        # batch taken out of the buffer, which is being written or waits for a retry
+        self._batch_logs: List[Dict[str, Any]] = []
+        self._batch_increments: Dict[UserScoreKey, float] = {}
+        self._batch_failures = 0
+
+    def add(
+        self,
+        guild_id: int,
+        channel_id: int,
+        member_id: int,
+        score_src: models.ScoreSource,
+        score_type: models.ScoreType,
+        score: float,
+    ):
+        self._logs.append(
+            new_score_log(
+                guild_id=guild_id,
+                channel_id=channel_id,
+                member_id=member_id,
+                score_src=score_src,
+                score=score,
+            )
+        )
+        key = (guild_id, member_id, score_type)
+        self._increments[key] = self._increments.get(key, 0) + score
+        self._notify()
+
+    def pending_score(
+        self, guild_id: int, member_id: int, score_type: models.ScoreType
+    ) -> float:
+        """Score which has been awarded but not flushed to the database yet."""
+        key = (guild_id, member_id, score_type)
+        return self._increments.get(key, 0) + self._batch_increments.get(key, 0)
+
+    def pending_member_score(
+        self,
+        member_id: int,
+        guild_id: Optional[int] = None,
+        score_type: Optional[models.ScoreType] = None,
+    ) -> float:
+        """Unflushed score of the member, in all guilds and of all types by default."""
+        return sum(
+            score
+            for (score_guild_id, score_member_id, score_score_type), score in (
+                itertools.chain(
+                    self._increments.items(), self._batch_increments.items()
+                )
+            )
+            if score_member_id == member_id
+            and (guild_id is None or score_guild_id == guild_id)
+            and (score_type is None or score_score_type == score_type)
+        )
+
+    def pending_scores(
+        self,
+        member_ids: Collection[int],
+        guild_id: Optional[int] = None,
+        score_type: Optional[models.ScoreType] = None,
+    ) -> Dict[Tuple[int, models.ScoreType], float]:
+        """Unflushed scores of the members by (member_id, score_type)."""
+        scores: Dict[Tuple[int, models.ScoreType], float] = {}
+        for (score_guild_id, member_id, score_score_type), score in itertools.chain(
+            self._increments.items(), self._batch_increments.items()
+        ):
+            if (
+                member_id in member_ids
+                and (guild_id is None or score_guild_id == guild_id)
+                and (score_type is None or score_score_type == score_type)
+            ):
+                key = (member_id, score_score_type)
+                scores[key] = scores.get(key, 0) + score
+        return scores
+
+    def _pending_count(self) -> int:
+        return len(self._logs) + len(self._batch_logs)
+
+    async def _flush(self):
+        if len(self._batch_logs) > 0:
+            # the failed batch is retried first, newer awards wait for it
+            await self._write_batch()
+        if len(self._logs) > 0:
+            self._batch_logs, self._batch_increments = self._logs, self._increments
+            self._logs, self._increments = [], {}
+            await self._write_batch()
+
+    async def _write_batch(self):
+        logs, increments = self._batch_logs, self._batch_increments
+        try:
+            async with db.session_scope() as sess:
+                await insert_score_logs(sess, logs)
+                await increment_user_scores(sess, increments)
+                await sess.commit()
+        except Exception:
+            self._batch_failures += 1
+            if self._batch_failures >= self._flush_attempts:
+                _logger.error(
+                    f"drop {len(logs)} score logs and {len(increments)} user scores "
+                    f"after {self._batch_failures} failed flushes, "
+                    f"user score increments: {increments}"
+                )
+                self._reset_batch()
+            raise
+
+        self._reset_batch()
+        _logger.debug(f"flush {len(logs)} score logs and {len(increments)} user scores")
+
+    def _reset_batch(self):
+        self._batch_logs, self._batch_increments = [], {}
+        self._batch_failures = 0
+
+
+score_buffer = ScoreBuffer()
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+import anyio
+import sqlalchemy as sa
+
+from fuo import config, db, models
+
+__all__ = ["compact_score_logs", "run_compaction"]
+
+_logger = logging.getLogger(__name__)
+
+
+def _write_archive(archive_dir: str, logs: List[Dict[str, Any]]):
+    """Write a chunk of score logs to a gzipped NDJSON file named by its id range."""
+    os.makedirs(archive_dir, exist_ok=True)
+    name = f"score_logs_{logs[0]['id']}_{logs[-1]['id']}.ndjson.gz"
+    path = os.path.join(archive_dir, name)
+    tmp_path = path + ".tmp"
+    with gzip.open(tmp_path, mode="wt", encoding="utf-8") as f:
+        for log in logs:
+            f.write(json.dumps(log) + "\n")
+    # a chunk is complete once it is renamed
+    os.replace(tmp_path, path)
+
+
+async def compact_score_logs(
+    retention_days: int = config.score_retention_days,
+    archive_dir: str = config.score_archive_dir,
+    batch_size: int = config.score_compact_batch_size,
+) -> int:
+    """
+    Archive score logs older than the retention days, and delete them.
+
+    Totals of the logs are kept in score rollups, which are written along with
+    the logs. Every chunk of logs is archived and deleted in its own short
+    transaction. Return the count of compacted logs.
+    """
+    before = datetime.now() - timedelta(days=retention_days)
+    total = 0
+    while True:
+        async with db.session_scope() as sess:
+            q = (
+                sa.select(models.ScoreLog)
+                .where(models.ScoreLog.created_at < before)
+                .order_by(sa.asc(models.ScoreLog.id))
+                .limit(batch_size)
+            )
+            logs = (await sess.execute(q)).scalars().all()
+            if len(logs) == 0:
+                break
+
+            rows = [
+                {
+                    "id": log.id,
+                    "guild_id": log.guild_id,
+                    "channel_id": log.channel_id,
+                    "member_id": log.member_id,
+                    "source": log.score_src.value,
+                    "score": log.score,
+                    "created_at": log.created_at.isoformat(),
+                }
+                for log in logs
+            ]
+            await anyio.to_thread.run_sync(_write_archive, archive_dir, rows)
+
+            q = sa.delete(models.ScoreLog).where(
+                models.ScoreLog.id.in_([log.id for log in logs])
+            )
+            await sess.execute(q)
+            await sess.commit()
+
+        total += len(logs)
+        _logger.debug(f"compact score logs {logs[0].id} to {logs[-1].id}")
+
+    _logger.info(f"compact {total} score logs created before {before}")
+    return total
+
+
+async def run_compaction(interval: float = config.score_compact_interval):
+    if interval <= 0:
+        return
+    while True:
+        await anyio.sleep(interval)
+        try:
+            await compact_score_logs()
+        except Exception as e:
+            _logger.error(f"compact score logs failed: {e}")
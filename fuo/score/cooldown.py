@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fuo import config, models
+
+__all__ = ["ScoreLogKey", "CooldownIndex", "cooldown_warm_query"]
+
+_logger = logging.getLogger(__name__)
+
+# (guild_id, channel_id, member_id, score_src)
+ScoreLogKey = Tuple[int, int, int, models.ScoreSource]
+
+
+def cooldown_warm_query(since: datetime) -> sa.Select:
+    """Time of the last score log of every cooldown key since the time."""
+    return (
+        sa.select(
+            models.ScoreLog.guild_id,
+            models.ScoreLog.channel_id,
+            models.ScoreLog.member_id,
+            models.ScoreLog.score_src,
+            sa.func.max(models.ScoreLog.created_at),
+        )
+        .where(models.ScoreLog.created_at >= since)
+        .group_by(
+            models.ScoreLog.guild_id,
+            models.ScoreLog.channel_id,
+            models.ScoreLog.member_id,
+            models.ScoreLog.score_src,
+        )
+    )
+
+
+class CooldownIndex(object):
+    """
+    Last award time of every (guild, channel, member, source) in cooldown.
+
+    Entries are kept in award order and dropped once their cooldown has passed,
+    or when the index grows beyond `max_size`, oldest first.
+    """
+
+    def __init__(self, max_size: int = config.score_cooldown_index_size) -> None:
+        self._max_size = max_size
+        # key -> (last award time, expire time)
+        self._entries: OrderedDict[ScoreLogKey, Tuple[float, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def in_cooldown(
+        self, key: ScoreLogKey, cooldown: int, now: Optional[float] = None
+    ) -> bool:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        if now is None:
+            now = time.time()
+        return now < entry[0] + cooldown
+
+    def record(self, key: ScoreLogKey, cooldown: int, now: Optional[float] = None):
+        if now is None:
+            now = time.time()
+        self._expire(now)
+
+        if cooldown <= 0:
+            self._entries.pop(key, None)
+            return
+
+        self._entries[key] = (now, now + cooldown)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def _expire(self, now: float):
+        while len(self._entries) > 0:
+            key, (_, expire_at) = next(iter(self._entries.items()))
+            if expire_at > now:
+                break
+            del self._entries[key]
+
+    async def warm(self, sess: AsyncSession, max_cooldown: int):
+        if max_cooldown <= 0:
+            return
+
+        q = cooldown_warm_query(since=datetime.now() - timedelta(seconds=max_cooldown))
+        rows = (await sess.execute(q)).all()
+        for guild_id, channel_id, member_id, score_src, created_at in sorted(
+            rows, key=lambda row: row[-1]
+        ):
+            t = created_at.timestamp()
+            self._entries[(guild_id, channel_id, member_id, score_src)] = (
+                t,
+                t + max_cooldown,
+            )
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+        _logger.info(f"warm cooldown index with {len(self._entries)} entries")
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Set
+
+from fuo import config, models
+
+__all__ = ["ScoreEvent", "ScoreSubscription", "ScoreEventBus", "score_events"]
+
+_logger = logging.getLogger(__name__)
+
+
+class ScoreEvent(NamedTuple):
+    guild_id: int
+    channel_id: int
+    member_id: int
+    score_src: models.ScoreSource
+    score_type: models.ScoreType
+    score: float
+    created_at: datetime
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "guild_id": self.guild_id,
+            "channel_id": self.channel_id,
+            "member_id": self.member_id,
+            "source": self.score_src.value,
+            "type": self.score_type.value,
+            "score": self.score,
+            "created_at": self.created_at.isoformat(),
+        }
+
+
+class ScoreSubscription(object):
+    """
+    Bounded queue of score events of a subscriber.
+
+    A subscriber which doesn't keep up is dropped when its queue is full,
+    `get` returns None once it is dropped.
+    """
+
+    def __init__(
+        self,
+        guild_id: Optional[int] = None,
+        member_id: Optional[int] = None,
+        queue_size: int = config.score_event_queue_size,
+    ) -> None:
+        self.guild_id = guild_id
+        self.member_id = member_id
+        self.dropped = False
+
+        self._queue: asyncio.Queue[Optional[ScoreEvent]] = asyncio.Queue(
+            maxsize=queue_size
+        )
+
+    def matches(self, event: ScoreEvent) -> bool:
+        if self.guild_id is not None and event.guild_id != self.guild_id:
+            return False
+        if self.member_id is not None and event.member_id != self.member_id:
+            return False
+        return True
+
+    def put(self, event: ScoreEvent) -> bool:
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            self.drop()
+            return False
+
+    def drop(self):
+        if self.dropped:
+            return
+        self.dropped = True
+        # pending events are discarded to make room for the end mark
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+    async def get(self) -> Optional[ScoreEvent]:
+        return await self._queue.get()
+
+
+class ScoreEventBus(object):
+    """
+    In-process pub/sub of score awards.
+
+    `publish` never blocks, so subscribers cannot slow down award processing.
+    """
+
+    def __init__(self, queue_size: int = config.score_event_queue_size) -> None:
+        self._queue_size = queue_size
+        self._subscriptions: Set[ScoreSubscription] = set()
+
+    def publish(self, event: ScoreEvent):
+        for sub in list(self._subscriptions):
+            if sub.matches(event) and not sub.put(event):
+                self._subscriptions.discard(sub)
+                _logger.warning("drop a slow subscriber of score events")
+
+    @contextmanager
+    def subscribe(
+        self, guild_id: Optional[int] = None, member_id: Optional[int] = None
+    ) -> Iterator[ScoreSubscription]:
+        sub = ScoreSubscription(
+            guild_id=guild_id, member_id=member_id, queue_size=self._queue_size
+        )
+        self._subscriptions.add(sub)
+        try:
+            yield sub
+        finally:
+            self._subscriptions.discard(sub)
+
+
+score_events = ScoreEventBus()
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import bisect
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fuo import models
+
+__all__ = ["RankedScores", "Leaderboard", "leaderboard"]
+
+_logger = logging.getLogger(__name__)
+
+# (-score, member_id), so that higher scores come first
+_RankKey = Tuple[float, int]
+
+
+class RankedScores(object):
+    """
+    Scores of members kept in rank order.
+
+    Rank keys are stored in a list of sorted buckets, the way the
+    sortedcontainers package does, so that an update only shifts one bucket.
+    Bucket lengths are summed by a Fenwick tree, so with B buckets `rank` and
+    finding the start of `top` take O(log B) besides a bisect in one bucket.
+    """
+
+    BUCKET_SIZE = 1000
+
+    def __init__(self) -> None:
+        self._scores: Dict[int, float] = {}
+        self._buckets: List[List[_RankKey]] = []
+        # the last key of every bucket
+        self._maxes: List[_RankKey] = []
+        # 1-based Fenwick tree of bucket lengths
+        self._counts: List[int] = [0]
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def _rebuild_counts(self):
+        """Rebuild the tree in O(B), after buckets are split or removed."""
+        counts = [0] * (len(self._buckets) + 1)
+        for i, bucket in enumerate(self._buckets, 1):
+            counts[i] += len(bucket)
+            parent = i + (i & -i)
+            if parent < len(counts):
+                counts[parent] += counts[i]
+        self._counts = counts
+
+    def _update_count(self, i: int, delta: int):
+        i += 1
+        while i < len(self._counts):
+            self._counts[i] += delta
+            i += i & -i
+
+    def _count_before(self, i: int) -> int:
+        """Number of keys in the buckets before the i-th one."""
+        count = 0
+        while i > 0:
+            count += self._counts[i]
+            i -= i & -i
+        return count
+
+    def _locate(self, index: int) -> Tuple[int, int]:
+        """(bucket, position in the bucket) of the key at the 0-based index."""
+        i = 0
+        step = 1 << (len(self._counts).bit_length() - 1)
+        while step > 0:
+            if i + step < len(self._counts) and self._counts[i + step] <= index:
+                i += step
+                index -= self._counts[i]
+            step >>= 1
+        return i, index
+
+    def _insert(self, key: _RankKey):
+        if len(self._buckets) == 0:
+            self._buckets.append([key])
+            self._maxes.append(key)
+            self._rebuild_counts()
+            return
+
+        i = bisect.bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            i -= 1
+        bucket = self._buckets[i]
+        bisect.insort(bucket, key)
+        self._maxes[i] = bucket[-1]
+
+        if len(bucket) > 2 * self.BUCKET_SIZE:
+            half = bucket[self.BUCKET_SIZE :]
+            del bucket[self.BUCKET_SIZE :]
+            self._buckets.insert(i + 1, half)
+            self._maxes[i] = bucket[-1]
+            self._maxes.insert(i + 1, half[-1])
+            self._rebuild_counts()
+        else:
+            self._update_count(i, 1)
+
+    def _remove(self, key: _RankKey):
+        i = bisect.bisect_left(self._maxes, key)
+        bucket = self._buckets[i]
+        del bucket[bisect.bisect_left(bucket, key)]
+        if len(bucket) == 0:
+            del self._buckets[i]
+            del self._maxes[i]
+            self._rebuild_counts()
+        else:
+            self._maxes[i] = bucket[-1]
+            self._update_count(i, -1)
+
+    def get(self, member_id: int) -> Optional[float]:
+        return self._scores.get(member_id)
+
+    def add(self, member_id: int, score: float):
+        old = self._scores.get(member_id)
+        if old is not None:
+            self._remove((-old, member_id))
+            score += old
+        self._scores[member_id] = score
+        self._insert((-score, member_id))
+
+    def rank(self, member_id: int) -> Optional[int]:
+        """1-based rank of the member, or None if the member has no score."""
+        score = self._scores.get(member_id)
+        if score is None:
+            return None
+
+        key = (-score, member_id)
+        i = bisect.bisect_left(self._maxes, key)
+        return self._count_before(i) + bisect.bisect_left(self._buckets[i], key) + 1
+
+    def top(self, k: int, offset: int = 0) -> List[Tuple[int, float]]:
+        """(member_id, score) of the members ranked from offset + 1 to offset + k."""
+        res: List[Tuple[int, float]] = []
+        if offset >= len(self._scores):
+            return res
+
+        i, offset = self._locate(offset)
+        for bucket in self._buckets[i:]:
+            for neg_score, member_id in bucket[offset : offset + k - len(res)]:
+                res.append((member_id, -neg_score))
+            offset = 0
+            if len(res) >= k:
+                break
+        return res
+
+
+class Leaderboard(object):
+    """
+    Ranked scores of every guild, by score type and in total.
+    """
+
+    def __init__(self) -> None:
+        # (guild_id, score_type or None for total) -> ranked scores
+        self._boards: Dict[Tuple[int, Optional[models.ScoreType]], RankedScores] = {}
+
+    def board(
+        self, guild_id: int, score_type: Optional[models.ScoreType] = None
+    ) -> RankedScores:
+        key = (guild_id, score_type)
+        board = self._boards.get(key)
+        if board is None:
+            board = RankedScores()
+            self._boards[key] = board
+        return board
+
+    def get(
+        self, guild_id: int, score_type: Optional[models.ScoreType] = None
+    ) -> RankedScores:
+        """Ranked scores to read, which are empty and not kept for unknown guilds."""
+        board = self._boards.get((guild_id, score_type))
+        return board if board is not None else RankedScores()
+
+    def add(
+        self,
+        guild_id: int,
+        member_id: int,
+        score_type: models.ScoreType,
+        score: float,
+    ):
+        self.board(guild_id, score_type).add(member_id, score)
+        self.board(guild_id, None).add(member_id, score)
+
+    async def load(self, sess: AsyncSession):
+        self._boards = {}
+        q = sa.select(
+            models.UserScore.guild_id,
+            models.UserScore.member_id,
+            models.UserScore.score_type,
+            models.UserScore.score,
+        )
+        count = 0
+        for guild_id, member_id, score_type, score in await sess.execute(q):
+            self.add(
+                guild_id=guild_id,
+                member_id=member_id,
+                score_type=score_type,
+                score=score,
+            )
+            count += 1
+        _logger.info(f"load {count} user scores into leaderboard")
+
+
+leaderboard = Leaderboard()
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+import sqlalchemy as sa
+
+from fuo import models
+
+__all__ = ["member_logs_query"]
+
+
+def member_logs_query(
+    member_id: int,
+    limit: int,
+    offset: int = 0,
+    after_id: Optional[int] = None,
+    before_id: Optional[int] = None,
+    guild_id: Optional[int] = None,
+    score_src: Optional[models.ScoreSource] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    descending: bool = False,
+) -> sa.Select:
+    """
+    Page of score logs of the member, by offset or after and before log ids.
+    """
+    q = (
+        sa.select(models.ScoreLog)
+        .where(models.ScoreLog.member_id == member_id)
+        .limit(limit)
+    )
+    # logs are scanned by the (member_id, id) index from the cursor,
+    # the other filters are checked on the scanned rows
+    if after_id is not None or before_id is not None:
+        if after_id is not None:
+            q = q.where(models.ScoreLog.id > after_id)
+        if before_id is not None:
+            q = q.where(models.ScoreLog.id < before_id)
+    else:
+        q = q.offset(offset)
+    if guild_id is not None:
+        q = q.where(models.ScoreLog.guild_id == guild_id)
+    if score_src is not None:
+        q = q.where(models.ScoreLog.score_src == score_src)
+    if since is not None:
+        q = q.where(models.ScoreLog.created_at >= since)
+    if until is not None:
+        q = q.where(models.ScoreLog.created_at < until)
+    if descending:
+        q = q.order_by(sa.desc(models.ScoreLog.id))
+    else:
+        q = q.order_by(sa.asc(models.ScoreLog.id))
+    return q
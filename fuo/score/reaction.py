@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+import sqlalchemy as sa
+
+from fuo import config, db, models
+
+from .buffer import WriteBehindBuffer
+
+__all__ = ["AnswerReactionBuffer", "answer_reaction_buffer", "answer_reaction_update"]
+
+_logger = logging.getLogger(__name__)
+
+# (guild_id, channel_id, message_id) of the answer
+AnswerKey = Tuple[int, int, int]
+
+
+def answer_reaction_update() -> sa.Update:
+    """Add like and dislike deltas to an answer, executed with b_* parameters."""
+    table = models.Answer.__table__
+    return (
+        sa.update(table)
+        .where(table.c.guild_id == sa.bindparam("b_guild_id"))
+        .where(table.c.channel_id == sa.bindparam("b_channel_id"))
+        .where(table.c.message_id == sa.bindparam("b_message_id"))
+        .values(
+            like=table.c.like + sa.bindparam("b_like"),
+            dislike=table.c.dislike + sa.bindparam("b_dislike"),
+            updated_at=datetime.now(),
+        )
+    )
+
+
+class AnswerReactionBuffer(WriteBehindBuffer):
+    """
+    Write-behind accumulator of like and dislike reactions on answers.
+
+    Reaction deltas are summed per answer message and written by `flush` as
+    atomic `like = like + ?, dislike = dislike + ?` updates.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = config.score_flush_interval,
+        flush_size: int = config.score_flush_size,
+    ) -> None:
+        super().__init__(flush_interval=flush_interval, flush_size=flush_size)
+
+        # answer -> [like delta, dislike delta]
+        self._deltas: Dict[AnswerKey, List[int]] = {}
+
+    def add(
+        self,
+        guild_id: int,
+        channel_id: int,
+        message_id: int,
+        like: int = 0,
+        dislike: int = 0,
+    ):
+        delta = self._deltas.setdefault((guild_id, channel_id, message_id), [0, 0])
+        delta[0] += like
+        delta[1] += dislike
+        self._notify()
+
+    def _pending_count(self) -> int:
+        return len(self._deltas)
+
+    async def _flush(self):
+        deltas = self._deltas
+        self._deltas = {}
+
+        q = answer_reaction_update()
+        params = [
+            {
+                "b_guild_id": guild_id,
+                "b_channel_id": channel_id,
+                "b_message_id": message_id,
+                "b_like": like,
+                "b_dislike": dislike,
+            }
+            for (guild_id, channel_id, message_id), (like, dislike) in deltas.items()
+            if like != 0 or dislike != 0
+        ]
+
+        try:
+            if len(params) > 0:
+                async with db.session_scope() as sess:
+                    await sess.execute(q, params)
+                    await sess.commit()
+        except BaseException:
+            # put the deltas back, they will be retried by the next flush
+            for key, (like, dislike) in deltas.items():
+                delta = self._deltas.setdefault(key, [0, 0])
+                delta[0] += like
+                delta[1] += dislike
+            raise
+
+        _logger.debug(f"flush reactions of {len(params)} answers")
+
+
+answer_reaction_buffer = AnswerReactionBuffer()
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import logging
+from typing import Dict, NamedTuple, Optional, Tuple
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fuo import models
+
+__all__ = ["ActionConfig", "ScoreConfigResolver"]
+
+_logger = logging.getLogger(__name__)
+
+# (score_src, guild_id, channel_id), channel_id is None for the guild wide config
+ScoreConfigKey = Tuple[models.ScoreSource, int, Optional[int]]
+
+
+class ActionConfig(NamedTuple):
+    score: float
+    cooldown: int
+
+
+class ScoreConfigResolver(object):
+    """
+    In-memory copy of `score_configs`.
+
+    An action config is resolved from the channel config first, then the guild
+    config, then the default. Resolved results, including defaults, are cached
+    until the next update.
+    """
+
+    def __init__(self, default_score: float, default_cooldown: int) -> None:
+        self._default = ActionConfig(score=default_score, cooldown=default_cooldown)
+        self._configs: Dict[ScoreConfigKey, ActionConfig] = {}
+        self._resolved: Dict[ScoreConfigKey, ActionConfig] = {}
+
+    async def load(self, sess: AsyncSession):
+        q = sa.select(
+            models.ScoreConfig.score_src,
+            models.ScoreConfig.guild_id,
+            models.ScoreConfig.channel_id,
+            models.ScoreConfig.score,
+            models.ScoreConfig.cooldown,
+        )
+        configs = {}
+        for score_src, guild_id, channel_id, score, cooldown in await sess.execute(q):
+            configs[(score_src, guild_id, channel_id)] = ActionConfig(
+                score=score, cooldown=cooldown or 0
+            )
+        self._configs = configs
+        self._resolved.clear()
+
+        _logger.info(f"load {len(configs)} score configs")
+
+    def resolve(
+        self,
+        score_src: models.ScoreSource,
+        guild_id: int,
+        channel_id: Optional[int] = None,
+    ) -> ActionConfig:
+        key = (score_src, guild_id, channel_id)
+        conf = self._resolved.get(key)
+        if conf is None:
+            conf = self._configs.get(key)
+            if conf is None and channel_id is not None:
+                conf = self._configs.get((score_src, guild_id, None))
+            if conf is None:
+                conf = self._default
+            self._resolved[key] = conf
+        return conf
+
+    def max_cooldown(self) -> int:
+        return max(
+            (conf.cooldown for conf in self._configs.values()),
+            default=self._default.cooldown,
+        )
+
+    def set_score(
+        self,
+        score_src: models.ScoreSource,
+        guild_id: int,
+        channel_id: Optional[int],
+        score: float,
+    ):
+        key = (score_src, guild_id, channel_id)
+        # a new config row is created with zero score and no cooldown
+        conf = self._configs.get(key, ActionConfig(score=0, cooldown=0))
+        self._configs[key] = conf._replace(score=score)
+        self._resolved.clear()
+
+    def set_cooldown(
+        self,
+        score_src: models.ScoreSource,
+        guild_id: int,
+        channel_id: Optional[int],
+        cooldown: int,
+    ):
+        key = (score_src, guild_id, channel_id)
+        conf = self._configs.get(key, ActionConfig(score=0, cooldown=0))
+        self._configs[key] = conf._replace(cooldown=cooldown)
+        self._resolved.clear()
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Collection, Dict, Optional
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fuo import models
+
+from .buffer import score_buffer
+
+__all__ = [
+    "member_score_query",
+    "period_score_query",
+    "members_scores_query",
+    "get_member_score",
+    "get_members_scores",
+]
+
+
+def member_score_query(
+    member_id: int,
+    guild_id: Optional[int] = None,
+    score_type: Optional[models.ScoreType] = None,
+) -> sa.Select:
+    q = sa.select(sa.func.sum(models.UserScore.score)).where(
+        models.UserScore.member_id == member_id
+    )
+    if guild_id is not None:
+        q = q.where(models.UserScore.guild_id == guild_id)
+    if score_type is not None:
+        q = q.where(models.UserScore.score_type == score_type)
+    return q
+
+
+def period_score_query(
+    member_id: int,
+    since: date,
+    guild_id: Optional[int] = None,
+    score_type: Optional[models.ScoreType] = None,
+) -> sa.Select:
+    # period scores are summed from daily rollups of score logs
+    q = (
+        sa.select(sa.func.sum(models.ScoreRollup.score))
+        .where(models.ScoreRollup.member_id == member_id)
+        .where(models.ScoreRollup.day >= since)
+    )
+    if guild_id is not None:
+        q = q.where(models.ScoreRollup.guild_id == guild_id)
+    if score_type is not None:
+        q = q.where(models.ScoreRollup.score_src.in_(score_type.sources))
+    return q
+
+
+def members_scores_query(
+    member_ids: Collection[int],
+    guild_id: Optional[int] = None,
+    score_type: Optional[models.ScoreType] = None,
+) -> sa.Select:
+    q = sa.select(
+        models.UserScore.member_id,
+        models.UserScore.score_type,
+        sa.func.sum(models.UserScore.score).label("sum"),
+    ).where(models.UserScore.member_id.in_(member_ids))
+    if guild_id is not None:
+        q = q.where(models.UserScore.guild_id == guild_id)
+    if score_type is not None:
+        q = q.where(models.UserScore.score_type == score_type)
+    return q.group_by(models.UserScore.member_id, models.UserScore.score_type)
+
+
+async def get_member_score(
+    sess: AsyncSession,
+    member_id: int,
+    guild_id: Optional[int] = None,
+    score_type: Optional[models.ScoreType] = None,
+    period: Optional[models.ScorePeriod] = None,
+) -> float:
+    """
+    Score of the member, in all guilds and of all types by default.
+
+    Awards which are not flushed yet are included. They are recent, so they
+    fall in the current period as well.
+    """
+    if period is not None:
+        q = period_score_query(
+            member_id, since=period.start(), guild_id=guild_id, score_type=score_type
+        )
+    else:
+        q = member_score_query(member_id, guild_id=guild_id, score_type=score_type)
+    score = (await sess.execute(q)).scalar_one_or_none() or 0
+    return score + score_buffer.pending_member_score(
+        member_id=member_id, guild_id=guild_id, score_type=score_type
+    )
+
+
+async def get_members_scores(
+    sess: AsyncSession,
+    member_ids: Collection[int],
+    guild_id: Optional[int] = None,
+    score_type: Optional[models.ScoreType] = None,
+) -> Dict[int, Dict[models.ScoreType, float]]:
+    """Scores of every type the members have, including unflushed awards."""
+    scores: Dict[int, Dict[models.ScoreType, float]] = {
+        member_id: {} for member_id in member_ids
+    }
+    q = members_scores_query(member_ids, guild_id=guild_id, score_type=score_type)
+    for member_id, member_score_type, score in await sess.execute(q):
+        scores[member_id][member_score_type] = score
+
+    pending = score_buffer.pending_scores(
+        scores.keys(), guild_id=guild_id, score_type=score_type
+    )
+    for (member_id, member_score_type), score in pending.items():
+        member_scores = scores[member_id]
+        member_scores[member_score_type] = (
+            member_scores.get(member_score_type, 0) + score
+        )
+    return scores
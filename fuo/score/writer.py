@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any, Dict, Mapping, Sequence, Tuple
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fuo import models
+
+__all__ = [
+    "UserScoreKey",
+    "new_score_log",
+    "insert_score_logs",
+    "increment_user_scores",
+]
+
+# (guild_id, member_id, score_type)
+UserScoreKey = Tuple[int, int, models.ScoreType]
+# (guild_id, channel_id, member_id, score_src, day)
+RollupKey = Tuple[int, int, int, models.ScoreSource, date]
+
+
+def new_score_log(
+    guild_id: int,
+    channel_id: int,
+    member_id: int,
+    score_src: models.ScoreSource,
+    score: float,
+) -> Dict[str, Any]:
+    now = datetime.now()
+    return {
+        "guild_id": guild_id,
+        "channel_id": channel_id,
+        "member_id": member_id,
+        "score_src": score_src,
+        "score": score,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def _upsert(
+    sess: AsyncSession,
+    table: sa.Table,
+    index_elements: Sequence[sa.Column],
+    increments: Sequence[str],
+) -> Any:
+    """
+    Dialect specific insert statement, which adds the increment columns
+    to the existing row of the same unique index instead.
+    """
+    dialect = sess.get_bind().dialect.name
+    if dialect == "mysql":
+        q = mysql.insert(table)
+        return q.on_duplicate_key_update(
+            updated_at=q.inserted.updated_at,
+            **{name: table.c[name] + q.inserted[name] for name in increments},
+        )
+    elif dialect in ("sqlite", "postgresql"):
+        q = (sqlite if dialect == "sqlite" else postgresql).insert(table)
+        set_ = {name: table.c[name] + q.excluded[name] for name in increments}
+        set_["updated_at"] = q.excluded.updated_at
+        return q.on_conflict_do_update(index_elements=index_elements, set_=set_)
+    else:
+        raise NotImplementedError(f"upsert is not supported by {dialect}")
+
+
+async def insert_score_logs(sess: AsyncSession, logs: Sequence[Dict[str, Any]]):
+    """Insert score logs, and add them to the daily score rollups."""
+    if len(logs) == 0:
+        return
+    await sess.execute(sa.insert(models.ScoreLog), list(logs))
+
+    now = datetime.now()
+    rollups: Dict[RollupKey, Dict[str, Any]] = {}
+    for log in logs:
+        day = log["created_at"].date()
+        key = (
+            log["guild_id"],
+            log["channel_id"],
+            log["member_id"],
+            log["score_src"],
+            day,
+        )
+        rollup = rollups.get(key)
+        if rollup is None:
+            rollup = {
+                "guild_id": log["guild_id"],
+                "channel_id": log["channel_id"],
+                "member_id": log["member_id"],
+                "score_src": log["score_src"],
+                "day": day,
+                "score": 0,
+                "count": 0,
+                "created_at": now,
+                "updated_at": now,
+            }
+            rollups[key] = rollup
+        rollup["score"] += log["score"]
+        rollup["count"] += 1
+
+    table = models.ScoreRollup.__table__
+    q = _upsert(
+        sess,
+        table,
+        index_elements=[
+            table.c.guild_id,
+            table.c.channel_id,
+            table.c.member_id,
+            table.c.score_src,
+            table.c.day,
+        ],
+        increments=["score", "count"],
+    )
+    await sess.execute(q, list(rollups.values()))
+
+
+async def increment_user_scores(
+    sess: AsyncSession, increments: Mapping[UserScoreKey, float]
+):
+    """
+    Add the increments to user scores with one upsert statement,
+    rows are created for members who have no score of the type yet.
+    """
+    if len(increments) == 0:
+        return
+
+    now = datetime.now()
+    rows = [
+        {
+            "guild_id": guild_id,
+            "member_id": member_id,
+            "score_type": score_type,
+            "score": score,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for (guild_id, member_id, score_type), score in increments.items()
+    ]
+
+    table = models.UserScore.__table__
+    q = _upsert(
+        sess,
+        table,
+        index_elements=[table.c.guild_id, table.c.member_id, table.c.score_type],
+        increments=["score"],
+    )
+    await sess.execute(q, rows)
@@ -1,20 +1,34 @@
 from .check import is_bot, is_command
 from .converter import (
     to_channel_type,
+    to_emoji_class,
+    to_score_period,
     to_score_source,
     to_score_type,
     timestr_to_seconds,
     seconds_to_timestr,
 )
-from .emoji import is_dislike_emoji, is_like_emoji, is_valid_emoji
+from .emoji import (
+    EmojiClassifier,
+    classify_emoji,
+    is_dislike_emoji,
+    is_like_emoji,
+    is_valid_emoji,
+    normalize_emoji,
+)
 
 __all__ = [
+    "EmojiClassifier",
+    "classify_emoji",
+    "normalize_emoji",
     "is_valid_emoji",
     "is_like_emoji",
     "is_dislike_emoji",
     "to_score_type",
     "to_channel_type",
     "to_score_source",
+    "to_emoji_class",
+    "to_score_period",
     "timestr_to_seconds",
     "seconds_to_timestr",
     "is_command",
@@ -29,6 +29,22 @@ def to_score_source(s: str) -> models.ScoreSource:
     return res
 
 
+def to_emoji_class(s: str) -> models.EmojiClass:
+    try:
+        res = models.EmojiClass[s.upper()]
+    except KeyError:
+        raise BadArgument(f"{s} is not a valid emoji class.")
+    return res
+
+
+def to_score_period(s: str) -> models.ScorePeriod:
+    try:
+        res = models.ScorePeriod[s.upper()]
+    except KeyError:
+        raise BadArgument(f"{s} is not a valid score period.")
+    return res
+
+
 def timestr_to_seconds(s: str) -> int:
     res = 0
     m = re.match(r"^((?P<hour>\d+)h)?((?P<minute>\d+)m)?((?P<second>\d+)s)?$", s)
@@ -1,36 +1,92 @@
 import logging
 import re
+from typing import Dict, Optional, Union
 
 import emoji as em
 
+from fuo.models import EmojiClass
+
 LIKE_EMOJI_CODES = ["thumbs_up", "hundred_points", "red_heart", "tears_of_joy"]
 DISLIKE_EMOJI_CODES = ["cross_mark", "neutral_face"]
 VALID_EMOJI_CODES = LIKE_EMOJI_CODES + DISLIKE_EMOJI_CODES
 
 _logger = logging.getLogger(__name__)
 
+# variation selectors and skin tone modifiers don't change the emoji class
+_EMOJI_MODIFIERS = dict.fromkeys(
+    [0xFE0E, 0xFE0F] + list(range(0x1F3FB, 0x1F400)), None
+)
+
+
+def normalize_emoji(emoji: str) -> str:
+    return emoji.translate(_EMOJI_MODIFIERS)
+
+
+def _build_emoji_table() -> Dict[str, EmojiClass]:
+    table = {}
+    for emoji, data in em.EMOJI_DATA.items():
+        code = data["en"]
+        if any(re.search(dst, code) is not None for dst in LIKE_EMOJI_CODES):
+            table[normalize_emoji(emoji)] = EmojiClass.LIKE
+        elif any(re.search(dst, code) is not None for dst in DISLIKE_EMOJI_CODES):
+            table[normalize_emoji(emoji)] = EmojiClass.DISLIKE
+    return table
+
+
+_EMOJI_TABLE = _build_emoji_table()
+
+
+def classify_emoji(emoji: str) -> Optional[EmojiClass]:
+    return _EMOJI_TABLE.get(normalize_emoji(emoji))
+
+
 def is_valid_emoji(emoji: str):
-    if em.is_emoji(emoji):
-        code = em.demojize(emoji)
-        for dst in VALID_EMOJI_CODES:
-            if re.search(dst, code) is not None:
-                return True
-    return False
+    return classify_emoji(emoji) is not None
 
 
 def is_like_emoji(emoji: str):
-    if em.is_emoji(emoji):
-        code = em.demojize(emoji)
-        for dst in LIKE_EMOJI_CODES:
-            if re.search(dst, code) is not None:
-                return True
-    return False
+    return classify_emoji(emoji) == EmojiClass.LIKE
 
 
 def is_dislike_emoji(emoji: str):
-    if em.is_emoji(emoji):
-        code = em.demojize(emoji)
-        for dst in DISLIKE_EMOJI_CODES:
-            if re.search(dst, code) is not None:
-                return True
-    return False
+    return classify_emoji(emoji) == EmojiClass.DISLIKE
+
+
+class EmojiClassifier(object):
+    """
+    Classify reaction emojis of guilds.
+
+    A guild can add its own unicode emojis, keyed by the normalized emoji,
+    and custom guild emojis, keyed by the emoji id, on top of the default ones.
+    """
+
+    def __init__(self) -> None:
+        self._guild_tables: Dict[int, Dict[Union[str, int], EmojiClass]] = {}
+
+    def classify(
+        self, guild_id: Optional[int], emoji: str, emoji_id: Optional[int] = None
+    ) -> Optional[EmojiClass]:
+        key = emoji_id if emoji_id is not None else normalize_emoji(emoji)
+        if guild_id is not None:
+            guild_table = self._guild_tables.get(guild_id)
+            if guild_table is not None and key in guild_table:
+                return guild_table[key]
+        if emoji_id is not None:
+            return None
+        return _EMOJI_TABLE.get(key)
+
+    def set(
+        self,
+        guild_id: int,
+        emoji: str,
+        emoji_class: EmojiClass,
+        emoji_id: Optional[int] = None,
+    ):
+        key = emoji_id if emoji_id is not None else normalize_emoji(emoji)
+        self._guild_tables.setdefault(guild_id, {})[key] = emoji_class
+
+    def remove(self, guild_id: int, emoji: str, emoji_id: Optional[int] = None):
+        key = emoji_id if emoji_id is not None else normalize_emoji(emoji)
+        guild_table = self._guild_tables.get(guild_id)
+        if guild_table is not None:
+            guild_table.pop(key, None)
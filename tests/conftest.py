@@ -0,0 +1,6 @@
+import os
+
+# fuo.config is loaded on import, point it to the test config first
+os.environ.setdefault(
+    "DELTA_NODE_CONFIG", os.path.join(os.path.dirname(__file__), "config.yaml")
+)
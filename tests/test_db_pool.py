@@ -0,0 +1,45 @@
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from fuo import db
+
+
+async def check_out_twice(path: Path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}",
+        poolclass=db._MeteredPool,
+        pool_size=1,
+        max_overflow=0,
+    )
+
+    @sa.event.listens_for(engine.sync_engine, "connect")
+    def _slow_connect(dbapi_connection, connection_record):
+        time.sleep(0.5)
+
+    async def hold(seconds: float):
+        async with engine.connect() as conn:
+            await conn.execute(sa.text("SELECT 1"))
+            await asyncio.sleep(seconds)
+
+    # the first checkout connects, the second one waits for it
+    await hold(0)
+    await asyncio.gather(hold(0.3), hold(0))
+    await engine.dispose()
+
+
+def test_pool_wait_excludes_connecting(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    metrics = db.PoolMetrics()
+    monkeypatch.setattr(db, "pool_metrics", metrics)
+
+    asyncio.run(check_out_twice(tmp_path / "fuo.db"))
+
+    assert metrics.checkouts == 3
+    assert metrics.timeouts == 0
+    # only the second concurrent checkout waited, connecting is not counted
+    assert 0.25 < metrics.wait_sum < 0.6
+    assert metrics.wait_counts[db.PoolMetrics.WAIT_BUCKETS.index(0.5)] == 1
@@ -0,0 +1,38 @@
+import random
+
+from fuo.score.leaderboard import RankedScores
+
+
+class SmallRankedScores(RankedScores):
+    # small buckets, so buckets are split and removed
+    BUCKET_SIZE = 4
+
+
+def expected_order(scores):
+    return sorted(scores, key=lambda member_id: (-scores[member_id], member_id))
+
+
+def test_rank_and_top_follow_scores():
+    rnd = random.Random(0)
+    board = SmallRankedScores()
+    scores = {}
+    for _ in range(2000):
+        member_id = rnd.randrange(200)
+        score = rnd.choice([-3, -1, 1, 2, 5])
+        board.add(member_id, score)
+        scores[member_id] = scores.get(member_id, 0) + score
+
+    order = expected_order(scores)
+    assert len(board) == len(order)
+    for rank, member_id in enumerate(order, 1):
+        assert board.rank(member_id) == rank
+    for offset in (0, 1, 7, len(order) - 3, len(order)):
+        assert board.top(10, offset=offset) == [
+            (member_id, scores[member_id]) for member_id in order[offset : offset + 10]
+        ]
+
+
+def test_unknown_member_has_no_rank():
+    board = RankedScores()
+    assert board.rank(1) is None
+    assert board.top(10) == []
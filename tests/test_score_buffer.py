@@ -0,0 +1,96 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from fuo import models
+from fuo.score import buffer as buffer_module
+from fuo.score.buffer import ScoreBuffer
+
+
+class FakeSession(object):
+    async def commit(self):
+        pass
+
+
+class FakeWriter(object):
+    """Stands in for the db writes of the buffer, failing while `fail` is set."""
+
+    def __init__(self, buffer: ScoreBuffer):
+        self.buffer = buffer
+        self.fail = False
+        self.written = 0.0
+        self.pending_during_write = []
+
+    async def insert_score_logs(self, sess, logs):
+        self.pending_during_write.append(
+            self.buffer.pending_score(1, 100, models.ScoreType.POST)
+        )
+
+    async def increment_user_scores(self, sess, increments):
+        if self.fail:
+            raise RuntimeError("db is down")
+        self.written += sum(increments.values())
+
+
+@pytest.fixture
+def writer(monkeypatch: pytest.MonkeyPatch) -> FakeWriter:
+    @asynccontextmanager
+    async def session_scope():
+        yield FakeSession()
+
+    writer = FakeWriter(ScoreBuffer(flush_interval=5, flush_size=100, flush_attempts=2))
+    monkeypatch.setattr(buffer_module.db, "session_scope", session_scope)
+    monkeypatch.setattr(buffer_module, "insert_score_logs", writer.insert_score_logs)
+    monkeypatch.setattr(
+        buffer_module, "increment_user_scores", writer.increment_user_scores
+    )
+    return writer
+
+
+def add(buffer: ScoreBuffer, score: float):
+    buffer.add(
+        guild_id=1,
+        channel_id=10,
+        member_id=100,
+        score_src=models.ScoreSource.POST,
+        score_type=models.ScoreType.POST,
+        score=score,
+    )
+
+
+def test_batch_is_pending_while_written(writer: FakeWriter):
+    add(writer.buffer, 3)
+    asyncio.run(writer.buffer.flush())
+
+    assert writer.pending_during_write == [3]
+    assert writer.buffer.pending_score(1, 100, models.ScoreType.POST) == 0
+    assert writer.written == 3
+
+
+def test_failed_batch_is_retried_before_newer_awards(writer: FakeWriter):
+    add(writer.buffer, 3)
+    writer.fail = True
+    with pytest.raises(RuntimeError):
+        asyncio.run(writer.buffer.flush())
+    add(writer.buffer, 4)
+    assert writer.buffer.pending_member_score(100) == 7
+
+    writer.fail = False
+    asyncio.run(writer.buffer.flush())
+    assert writer.written == 7
+    assert writer.buffer.pending_member_score(100) == 0
+
+
+def test_failed_batch_is_dropped_after_attempts(writer: FakeWriter):
+    add(writer.buffer, 3)
+    writer.fail = True
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            asyncio.run(writer.buffer.flush())
+    assert writer.buffer.pending_member_score(100) == 0
+
+    writer.fail = False
+    add(writer.buffer, 4)
+    asyncio.run(writer.buffer.flush())
+    assert writer.written == 4
@@ -0,0 +1,70 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from fuo import db, models
+from fuo.score import totals
+from fuo.score.buffer import ScoreBuffer
+from fuo.score.writer import increment_user_scores, insert_score_logs, new_score_log
+
+GUILD_ID = 1
+MEMBER_ID = 100
+
+
+async def award_flushed_and_buffered(path: Path, buffer: ScoreBuffer):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(db.Base.metadata.create_all)
+
+    async with AsyncSession(engine) as sess:
+        # 6 points are flushed, 50 more are still buffered
+        await insert_score_logs(
+            sess,
+            [
+                new_score_log(
+                    guild_id=GUILD_ID,
+                    channel_id=10,
+                    member_id=MEMBER_ID,
+                    score_src=models.ScoreSource.POST,
+                    score=6,
+                )
+            ],
+        )
+        await increment_user_scores(
+            sess, {(GUILD_ID, MEMBER_ID, models.ScoreType.POST): 6}
+        )
+        await sess.commit()
+        buffer.add(
+            guild_id=GUILD_ID,
+            channel_id=10,
+            member_id=MEMBER_ID,
+            score_src=models.ScoreSource.POST,
+            score_type=models.ScoreType.POST,
+            score=50,
+        )
+
+        all_time = await totals.get_member_score(sess, member_id=MEMBER_ID)
+        period = await totals.get_member_score(
+            sess, member_id=MEMBER_ID, period=models.ScorePeriod.DAY
+        )
+        scores = await totals.get_members_scores(sess, member_ids=[MEMBER_ID, 200])
+    await engine.dispose()
+    return all_time, period, scores
+
+
+def test_pending_awards_are_in_all_totals(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    buffer = ScoreBuffer()
+    monkeypatch.setattr(totals, "score_buffer", buffer)
+
+    all_time, period, scores = asyncio.run(
+        award_flushed_and_buffered(tmp_path / "fuo.db", buffer)
+    )
+
+    assert period <= all_time
+    assert all_time == 56
+    assert period == 56
+    assert scores == {MEMBER_ID: {models.ScoreType.POST: 56}, 200: {}}